@@ -0,0 +1,88 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Compares two benchmark result files and reports regressions.
+
+Usage::
+
+    python -m benchmarks.compare_results baseline.json candidate.json --threshold 0.1
+
+Exits with a non-zero status if any benchmark's median wall time regressed more than the threshold.
+"""
+
+import argparse
+import json
+from statistics import median
+import sys
+
+
+def median_wall_times(report):
+    """Calculates median wall time for each benchmark.
+
+    Args:
+        report (dict): benchmark report
+
+    Returns:
+        dict: mapping from benchmark name to median wall time in seconds
+    """
+    times = {}
+    for result in report["results"]:
+        if "error" in result:
+            continue
+        times.setdefault(result["name"], []).append(result["wall_time_s"])
+    return {name: median(values) for name, values in times.items()}
+
+
+def compare(baseline, candidate, threshold):
+    """Compares median wall times of two reports.
+
+    Args:
+        baseline (dict): baseline report
+        candidate (dict): candidate report
+        threshold (float): relative slowdown that counts as a regression
+
+    Returns:
+        tuple: list of comparison rows (name, baseline time, candidate time, relative change) and list of regressed names
+    """
+    baseline_times = median_wall_times(baseline)
+    candidate_times = median_wall_times(candidate)
+    rows = []
+    regressions = []
+    for name in sorted(baseline_times.keys() & candidate_times.keys()):
+        old = baseline_times[name]
+        new = candidate_times[name]
+        change = (new - old) / old if old > 0.0 else 0.0
+        rows.append((name, old, new, change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two export benchmark result files.")
+    parser.add_argument("baseline", help="baseline results JSON")
+    parser.add_argument("candidate", help="candidate results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative slowdown, default 0.1")
+    args = parser.parse_args(argv)
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.candidate) as candidate_file:
+        candidate = json.load(candidate_file)
+    rows, regressions = compare(baseline, candidate, args.threshold)
+    for name, old, new, change in rows:
+        marker = " REGRESSION" if name in regressions else ""
+        print(f"{name:<24} {old:10.3f} s {new:10.3f} s {change:+8.1%}{marker}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Benchmarks Exporter's output formats and the preview path against synthetic databases.
+
+Run from repository root::
+
+    python -m benchmarks.export_benchmark --output results.json
+
+Every benchmark runs in a fresh process so peak memory usage is measured per benchmark.
+"""
+
+import argparse
+from datetime import datetime, timezone
+import json
+import multiprocessing
+from pathlib import Path
+import platform
+import sys
+import tempfile
+from time import perf_counter
+from spine_engine.utils.helpers import resolve_gams_executable
+from spine_items.exporter.do_work import do_work
+from spine_items.exporter.preview_table_writer import TableWriter
+from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from spinedb_api import DatabaseMapping
+from spinedb_api import __version__ as spinedb_api_version
+from spinedb_api.export_mapping.export_mapping import Position
+from spinedb_api.export_mapping.group_functions import NoGroup
+from spinedb_api.export_mapping.settings import entity_parameter_value_export
+from spinedb_api.spine_io.exporters.writer import Writer, write
+from .synthetic_database import DatabaseSize, build_database
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+PREVIEW_MAX_TABLES = 20
+PREVIEW_MAX_ROWS = 20
+_HEADERS = ("parameter", "entity", "alternative", "time", "value")
+
+
+class _Logger:
+    """Logger that discards messages except errors."""
+
+    class _Signal:
+        def __init__(self, sink=None):
+            self._sink = sink
+
+        def emit(self, *args):
+            if self._sink is not None:
+                self._sink(*args)
+
+    def __init__(self):
+        self.errors = []
+        self.msg = self._Signal()
+        self.msg_success = self._Signal()
+        self.msg_warning = self._Signal()
+        self.msg_error = self._Signal(self.errors.append)
+        self.msg_proc = self._Signal()
+        self.msg_proc_error = self._Signal()
+
+
+class _RowCounter(Writer):
+    """Writer that only counts rows."""
+
+    def __init__(self):
+        self.rows = 0
+
+    def start_table(self, table_name, title_key):
+        return True
+
+    def write_row(self, row):
+        self.rows += 1
+        return True
+
+
+def make_mapping_root():
+    """Creates the mapping used by the benchmarks.
+
+    Returns:
+        ExportMapping: root mapping
+    """
+    root = entity_parameter_value_export(
+        entity_class_position=Position.table_name,
+        definition_position=0,
+        entity_position=1,
+        alternative_position=2,
+        index_name_positions=[Position.hidden],
+        index_positions=[3],
+        value_position=4,
+    )
+    for mapping in root.flatten():
+        if isinstance(mapping.position, int):
+            mapping.header = _HEADERS[mapping.position]
+    return root
+
+
+def make_specification(output_format):
+    """Creates export specification for given output format.
+
+    Args:
+        output_format (OutputFormat): output format
+
+    Returns:
+        Specification: export specification
+    """
+    mapping_specification = MappingSpecification(
+        MappingType.entity_parameter_values, True, True, NoGroup.NAME, False, make_mapping_root()
+    )
+    return Specification("benchmark", "", {"parameter values": mapping_specification}, output_format)
+
+
+def count_rows(url):
+    """Counts the rows the benchmark mapping produces.
+
+    Args:
+        url (str): database URL
+
+    Returns:
+        int: number of rows including headers
+    """
+    counter = _RowCounter()
+    with DatabaseMapping(url) as db_map:
+        write(db_map, counter, make_mapping_root())
+    return counter.rows
+
+
+def _peak_rss_kib():
+    """Returns the peak resident set size of current process.
+
+    Returns:
+        int: peak RSS in KiB or None if unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _export_job(url, output_format, gams_path, out_dir):
+    """Exports the database into a file.
+
+    Args:
+        url (str): database URL
+        output_format (OutputFormat): output format
+        gams_path (str): path to GAMS executable
+        out_dir (str): output directory
+
+    Returns:
+        str: error message or None if export was successful
+    """
+    logger = _Logger()
+    specification = make_specification(output_format).to_dict()
+    success, _ = do_work(None, specification, False, True, gams_path, out_dir, {url: "out"}, {}, "", "", logger)
+    if not success:
+        return "; ".join(str(error) for error in logger.errors) or "export failed"
+    return None
+
+
+def _preview_job(url):
+    """Writes the preview tables the specification editor would show.
+
+    Args:
+        url (str): database URL
+
+    Returns:
+        str: always None
+    """
+    with DatabaseMapping(url) as db_map:
+        write(db_map, TableWriter(), make_mapping_root(), max_tables=PREVIEW_MAX_TABLES, max_rows=PREVIEW_MAX_ROWS)
+    return None
+
+
+def _run_measured(queue, job, args):
+    """Runs a job and puts its measurements into queue.
+
+    Args:
+        queue (multiprocessing.Queue): result queue
+        job (Callable): job to run
+        args (tuple): job's arguments
+    """
+    start = perf_counter()
+    try:
+        error = job(*args)
+    except Exception as exception:  # pylint: disable=broad-except
+        error = str(exception)
+    queue.put((perf_counter() - start, _peak_rss_kib(), error))
+
+
+def measure(job, *args):
+    """Runs job in a fresh process and measures its wall time and peak memory.
+
+    Args:
+        job (Callable): job to run
+        *args: job's arguments
+
+    Returns:
+        tuple: wall time in seconds, peak RSS in KiB or None, error message or None
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_measured, args=(queue, job, args))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def benchmark_formats(skip_gdx):
+    """Lists output formats to benchmark.
+
+    Args:
+        skip_gdx (bool): True to skip GDX
+
+    Returns:
+        list of OutputFormat: output formats
+    """
+    return [output_format for output_format in OutputFormat if not (skip_gdx and output_format == OutputFormat.GDX)]
+
+
+def run(size, repeat, work_dir):
+    """Runs all benchmarks.
+
+    Args:
+        size (DatabaseSize): synthetic database dimensions
+        repeat (int): how many times each benchmark is repeated
+        work_dir (Path): directory for the database and output files
+
+    Returns:
+        list of dict: benchmark results
+    """
+    url = "sqlite:///" + str(work_dir / "source.sqlite")
+    build_database(url, size)
+    rows = count_rows(url)
+    gams_path = resolve_gams_executable("")
+    jobs = []
+    for output_format in benchmark_formats(skip_gdx=not gams_path):
+        jobs.append((f"export_{output_format.name.lower()}", rows, _export_job, (url, output_format, gams_path)))
+    jobs.append(("preview", None, _preview_job, (url,)))
+    results = []
+    for name, job_rows, job, args in jobs:
+        for round_ in range(repeat):
+            if job is _export_job:
+                round_args = args + (str(work_dir / f"{name}_{round_}"),)
+            else:
+                round_args = args
+            wall_time, peak_rss, error = measure(job, *round_args)
+            result = {"name": name, "round": round_, "wall_time_s": wall_time, "peak_rss_kib": peak_rss}
+            if job_rows is not None:
+                result["rows"] = job_rows
+                result["rows_per_second"] = job_rows / wall_time if wall_time > 0.0 else None
+            if error is not None:
+                result["error"] = error
+            results.append(result)
+            print(f"{name} [{round_ + 1}/{repeat}]: {wall_time:.3f} s" + (f" ERROR: {error}" if error else ""))
+    return results
+
+
+def metadata(size):
+    """Collects environment information for the result file.
+
+    Args:
+        size (DatabaseSize): synthetic database dimensions
+
+    Returns:
+        dict: metadata
+    """
+    try:
+        from spine_items.version import __version__ as spine_items_version
+    except ImportError:
+        spine_items_version = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spine_items": spine_items_version,
+        "spinedb_api": spinedb_api_version,
+        "database": size.to_dict(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Exporter against a synthetic Spine database.")
+    parser.add_argument("--entity-classes", type=int, default=DatabaseSize.entity_classes)
+    parser.add_argument("--entities", type=int, default=DatabaseSize.entities_per_class, help="entities per class")
+    parser.add_argument("--parameters", type=int, default=DatabaseSize.parameters_per_class, help="per class")
+    parser.add_argument("--time-series-length", type=int, default=DatabaseSize.time_series_length)
+    parser.add_argument("--scenarios", type=int, default=DatabaseSize.scenarios)
+    parser.add_argument("--repeat", type=int, default=1, help="rounds per benchmark")
+    parser.add_argument("--output", help="JSON file to write results to")
+    args = parser.parse_args(argv)
+    size = DatabaseSize(args.entity_classes, args.entities, args.parameters, args.time_series_length, args.scenarios)
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run(size, args.repeat, Path(work_dir))
+    report = {"metadata": metadata(size), "results": results}
+    if args.output:
+        with open(args.output, "w") as out_file:
+            json.dump(report, out_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
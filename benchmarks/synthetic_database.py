@@ -0,0 +1,80 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Generates synthetic Spine databases for benchmarking."""
+
+from dataclasses import asdict, dataclass
+import numpy
+from spinedb_api import DatabaseMapping, import_data
+from spinedb_api.parameter_value import TimeSeriesFixedResolution
+
+
+@dataclass(frozen=True)
+class DatabaseSize:
+    """Dimensions of a synthetic database."""
+
+    entity_classes: int = 2
+    entities_per_class: int = 100
+    parameters_per_class: int = 2
+    time_series_length: int = 24
+    scenarios: int = 1
+
+    def to_dict(self):
+        """Serializes the size.
+
+        Returns:
+            dict: serialized size
+        """
+        return asdict(self)
+
+
+def build_database(url, size):
+    """Creates and populates a synthetic Spine database.
+
+    Every scenario gets an alternative of its own,
+    and every entity gets a time series value for every parameter in every alternative.
+
+    Args:
+        url (str): database URL
+        size (DatabaseSize): database dimensions
+    """
+    class_names = [f"class_{i}" for i in range(size.entity_classes)]
+    alternative_names = [f"alternative_{i}" for i in range(size.scenarios)]
+    entities = []
+    parameter_definitions = []
+    parameter_values = []
+    for class_index, class_name in enumerate(class_names):
+        entity_names = [f"entity_{class_index}_{i}" for i in range(size.entities_per_class)]
+        entities += [(class_name, name) for name in entity_names]
+        parameter_names = [f"parameter_{i}" for i in range(size.parameters_per_class)]
+        parameter_definitions += [(class_name, name) for name in parameter_names]
+        for alternative_index, alternative_name in enumerate(alternative_names):
+            for entity_index, entity_name in enumerate(entity_names):
+                for parameter_index, parameter_name in enumerate(parameter_names):
+                    offset = alternative_index + entity_index + parameter_index
+                    values = numpy.arange(offset, offset + size.time_series_length, dtype=float)
+                    value = TimeSeriesFixedResolution("2020-01-01T00:00", "1h", values, False, False)
+                    parameter_values.append((class_name, entity_name, parameter_name, value, alternative_name))
+    with DatabaseMapping(url, create=True) as db_map:
+        _, errors = import_data(
+            db_map,
+            entity_classes=[(name, ()) for name in class_names],
+            entities=entities,
+            parameter_definitions=parameter_definitions,
+            alternatives=[(name, "") for name in alternative_names],
+            scenarios=[(f"scenario_{i}", False, "") for i in range(size.scenarios)],
+            scenario_alternatives=[(f"scenario_{i}", name) for i, name in enumerate(alternative_names)],
+            parameter_values=parameter_values,
+        )
+        if errors:
+            raise RuntimeError(f"Failed to build synthetic database: {errors}")
+        db_map.commit_session("Add synthetic data.")
@@ -0,0 +1,229 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains writers that export tables into Apache Arrow backed columnar files."""
+
+import os
+import os.path
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+from spinedb_api import parameter_value
+from spinedb_api.spine_io.exporters.writer import Writer, WriterException
+
+DEFAULT_BATCH_SIZE = 65536
+"""Number of rows buffered before they are written as a single record batch or row group."""
+
+
+class _ColumnarWriter(Writer):
+    """Base class for writers that write typed columns in row batches.
+
+    Like the SQL writer, this writer expects the first row of each table to contain the column names.
+    Column types are sniffed from the first batch of rows.
+    """
+
+    _file_extension = NotImplemented
+
+    def __init__(self, path, backup_file_name, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            path (Path or str): path to output directory
+            backup_file_name (str): output file name if no table name is provided by the mappings
+            batch_size (int): maximum number of rows per record batch
+        """
+        super().__init__()
+        self._path = path
+        self._default_table_name = backup_file_name
+        self._batch_size = batch_size
+        self._file_writers = {}
+        self._file_name = None
+        self._column_names = None
+        self._rows = []
+        self._finished_files = set()
+
+    def output_files(self):
+        """Returns absolute paths to files that have been written.
+
+        Returns:
+            set of str: file paths
+        """
+        return self._finished_files
+
+    def finish(self):
+        """Closes all open files."""
+        for file_writer, _ in self._file_writers.values():
+            file_writer.close()
+        self._file_writers.clear()
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if table_name is None:
+            table_name = self._default_table_name
+        else:
+            table_name = table_name + "." + self._file_extension
+        self._file_name = os.path.join(self._path, table_name)
+        if self._file_name not in self._file_writers and os.path.exists(self._file_name):
+            os.remove(self._file_name)
+        self._column_names = None
+        self._rows = []
+        return True
+
+    def finish_table(self):
+        """See base class."""
+        if self._file_name is not None and self._column_names is not None:
+            self._flush()
+            self._finished_files.add(self._file_name)
+        self._file_name = None
+        self._column_names = None
+        self._rows = []
+
+    def write_row(self, row):
+        """See base class."""
+        if self._column_names is None:
+            self._column_names = [str(name) for name in row]
+            return True
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+        return True
+
+    def _flush(self):
+        """Writes buffered rows as a record batch."""
+        file_writer, schema = self._file_writers.get(self._file_name, (None, None))
+        if file_writer is None:
+            schema = pyarrow.schema(
+                [
+                    (name, _sniff_type(column))
+                    for name, column in zip(self._column_names, _transpose(self._rows, len(self._column_names)))
+                ]
+            )
+            file_writer = self._open_file(self._file_name, schema)
+            self._file_writers[self._file_name] = file_writer, schema
+        elif schema.names != self._column_names:
+            raise WriterException(f"Columns of table '{os.path.basename(self._file_name)}' do not match.")
+        if not self._rows:
+            return
+        arrays = []
+        for field, column in zip(schema, _transpose(self._rows, len(schema))):
+            try:
+                arrays.append(pyarrow.array(_convert(column, field.type), type=field.type))
+            except (TypeError, ValueError, pyarrow.ArrowException) as error:
+                raise WriterException(f"Failed to convert values in column '{field.name}': {error}") from error
+        file_writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+        self._rows = []
+
+    def _open_file(self, file_name, schema):
+        """Opens a new output file.
+
+        Args:
+            file_name (str): path to the file
+            schema (pyarrow.Schema): table schema
+
+        Returns:
+            Any: file writer that has ``write_batch()`` and ``close()`` methods
+        """
+        raise NotImplementedError()
+
+
+class ParquetWriter(_ColumnarWriter):
+    """Export writer that writes Apache Parquet files; each batch becomes a row group."""
+
+    _file_extension = "parquet"
+
+    def _open_file(self, file_name, schema):
+        """See base class."""
+        return pyarrow.parquet.ParquetWriter(file_name, schema)
+
+
+class ArrowIpcWriter(_ColumnarWriter):
+    """Export writer that writes Apache Arrow IPC (Feather version 2) files."""
+
+    _file_extension = "arrow"
+
+    def _open_file(self, file_name, schema):
+        """See base class."""
+        return pyarrow.ipc.new_file(file_name, schema)
+
+
+def _transpose(rows, column_count):
+    """Turns a list of rows into a list of columns.
+
+    Args:
+        rows (list of list): rows
+        column_count (int): number of columns
+
+    Returns:
+        list of tuple: columns
+    """
+    if not rows:
+        return column_count * [()]
+    return list(zip(*rows))
+
+
+def _sniff_type(column):
+    """Chooses Arrow data type for a column.
+
+    Args:
+        column (Sequence): column values
+
+    Returns:
+        pyarrow.DataType: column's type
+    """
+    values = [x for x in column if x is not None]
+    if not values:
+        return pyarrow.string()
+    if all(isinstance(x, bool) for x in values):
+        return pyarrow.bool_()
+    if all(isinstance(x, int) and not isinstance(x, bool) for x in values):
+        return pyarrow.int64()
+    if all(isinstance(x, (float, int)) and not isinstance(x, bool) for x in values):
+        return pyarrow.float64()
+    if all(isinstance(x, parameter_value.DateTime) for x in values):
+        return pyarrow.timestamp("us")
+    return pyarrow.string()
+
+
+def _convert(column, data_type):
+    """Converts column values to match given Arrow data type.
+
+    Args:
+        column (Sequence): column values
+        data_type (pyarrow.DataType): target data type
+
+    Returns:
+        list: converted values
+    """
+    if data_type == pyarrow.string():
+        return [_to_string(x) for x in column]
+    if pyarrow.types.is_timestamp(data_type):
+        return [x.value if isinstance(x, parameter_value.DateTime) else x for x in column]
+    if data_type == pyarrow.float64():
+        return [float(x) if x is not None else None for x in column]
+    if data_type == pyarrow.int64():
+        return [int(x) if x is not None else None for x in column]
+    return list(column)
+
+
+def _to_string(x):
+    """Converts a value to string.
+
+    Args:
+        x (Any): value
+
+    Returns:
+        str: string representation or None if value is None
+    """
+    if x is None or isinstance(x, str):
+        return x
+    if isinstance(x, parameter_value.Duration):
+        return parameter_value.relativedelta_to_duration(x.value)
+    return str(x)
@@ -0,0 +1,131 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains an SQL writer that loads data in batches inside a single transaction."""
+
+import sys
+from sqlalchemy import Column, String, Table
+from spinedb_api.spine_io.exporters.sql_writer import SqlWriter, _converters, _database_columns_and_converters
+from spinedb_api.spine_io.exporters.writer import WriterException
+
+INDEX_REBUILD_DIALECTS = {"postgresql", "sqlite"}
+"""Dialects that support dropping and recreating indexes inside a transaction."""
+
+
+class BulkSqlWriter(SqlWriter):
+    """SQL writer that inserts rows in batches and commits once after all tables have been written.
+
+    Indexes of existing tables are dropped before loading and rebuilt afterwards if the dialect allows it.
+    """
+
+    def __init__(self, database, overwrite_existing, batch_size):
+        """
+        Args:
+            database (str): URL or path to output .sqlite file
+            overwrite_existing (bool): if True, overwrites tables in existing database, otherwise appends to the tables
+            batch_size (int): number of rows per multi-row insert
+        """
+        super().__init__(database, overwrite_existing)
+        if batch_size < 1:
+            raise WriterException("Bulk insert batch size must be positive.")
+        self._batch_size = batch_size
+        self._rows = []
+        self._dropped_indexes = {}
+        self.row_count = 0
+
+    def finish(self):
+        """Rebuilds indexes, commits the transaction and closes the database connection.
+
+        Since :func:`write` calls this from a ``finally`` block, the transaction is rolled back instead
+        if writing was interrupted by an exception.
+        """
+        try:
+            if sys.exc_info()[0] is None:
+                self._flush()
+                connection = self._session.connection()
+                for indexes in self._dropped_indexes.values():
+                    for index in indexes:
+                        index.create(connection)
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._dropped_indexes.clear()
+            super().finish()
+
+    def finish_table(self):
+        """See base class."""
+        self._flush()
+        if self._column_names and self._table is None:
+            # Create an empty table if no rows were available in the database.
+            columns = [Column(name, String) for name in self._column_names]
+            self._table = Table(self._table_name, self._metadata, *columns)
+            self._table.create(self._session.connection())
+        self._finished_table_names.add(self._table_name)
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if not table_name:
+            raise WriterException("Cannot create anonymous SQL tables.")
+        self._table = self._metadata.tables.get(table_name)
+        if self._overwrite_existing and self._table is not None and table_name not in self._finished_table_names:
+            self._dropped_indexes.pop(table_name, None)
+            self._table.drop(self._session.connection())
+            self._metadata.remove(self._table)
+            self._table = None
+        if self._table is not None and table_name not in self._dropped_indexes:
+            self._drop_indexes(self._table)
+        self._table_name = table_name
+        self._column_names = None
+        self._column_converters = None
+        return True
+
+    def write_row(self, row):
+        """See base class."""
+        if self._column_names is None:
+            # Expecting first row to contain column names as headers.
+            self._column_names = row
+            return True
+        if self._table is None:
+            columns, self._column_converters = _database_columns_and_converters(self._column_names, row)
+            self._table = Table(self._table_name, self._metadata, *columns)
+            self._table.create(self._session.connection())
+        elif self._column_converters is None:
+            self._column_converters = _converters(row)
+        self._rows.append(tuple(convert(x) for convert, x in zip(self._column_converters, row)))
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+        return True
+
+    def _flush(self):
+        """Inserts buffered rows into current table."""
+        if not self._rows:
+            return
+        keys = [column.key for column in self._table.columns]
+        self._session.execute(self._table.insert(), [dict(zip(keys, row)) for row in self._rows])
+        self.row_count += len(self._rows)
+        self._rows = []
+
+    def _drop_indexes(self, table):
+        """Drops table's indexes for the duration of the load.
+
+        Args:
+            table (Table): database table
+        """
+        if self._engine.dialect.name not in INDEX_REBUILD_DIALECTS:
+            self._dropped_indexes[table.name] = []
+            return
+        indexes = list(table.indexes)
+        self._dropped_indexes[table.name] = indexes
+        connection = self._session.connection()
+        for index in indexes:
+            index.drop(connection)
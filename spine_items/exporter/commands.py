@@ -583,6 +583,46 @@ class SetExportFormat(QUndoCommand):
         self._specification_editor.set_export_format_silently(self._previous_format)
 
 
+class SetExportCompression(QUndoCommand):
+    def __init__(self, editor, compression, previous_compression):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            compression (OutputCompression): new compression
+            previous_compression (OutputCompression): previous compression
+        """
+        super().__init__("change export compression")
+        self._specification_editor = editor
+        self._compression = compression
+        self._previous_compression = previous_compression
+
+    def redo(self):
+        self._specification_editor.set_export_compression_silently(self._compression)
+
+    def undo(self):
+        self._specification_editor.set_export_compression_silently(self._previous_compression)
+
+
+class SetBulkInsertBatchSize(QUndoCommand):
+    def __init__(self, editor, batch_size, previous_batch_size):
+        """
+        Args:
+            editor (SpecificationEditor): specification editor window
+            batch_size (int): new batch size
+            previous_batch_size (int): previous batch size
+        """
+        super().__init__("change bulk insert batch size")
+        self._specification_editor = editor
+        self._batch_size = batch_size
+        self._previous_batch_size = previous_batch_size
+
+    def redo(self):
+        self._specification_editor.set_bulk_insert_batch_size_silently(self._batch_size)
+
+    def undo(self):
+        self._specification_editor.set_bulk_insert_batch_size_silently(self._previous_batch_size)
+
+
 class UpdateOutputTimeStampsFlag(SpineToolboxCommand):
     """Command to set exporter's output directory time stamps flag."""
 
@@ -606,3 +646,30 @@ class UpdateOutputTimeStampsFlag(SpineToolboxCommand):
     def undo(self):
         exporter = self._project.get_item(self._exporter_name)
         exporter.set_output_time_stamps_flag(not self._value)
+
+
+class UpdateMaxKeptRuns(SpineToolboxCommand):
+    """Command to set the number of time stamped output directories exporter keeps."""
+
+    def __init__(self, exporter_name, value, previous_value, project):
+        """
+        Args:
+            exporter_name (str): exporter's name
+            value (int): new number of kept runs
+            previous_value (int): previous number of kept runs
+            project (SpineToolboxProject): project
+        """
+        super().__init__()
+        self.setText(f"change kept runs setting of {exporter_name}")
+        self._exporter_name = exporter_name
+        self._value = value
+        self._previous_value = previous_value
+        self._project = project
+
+    def redo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_max_kept_runs(self._value)
+
+    def undo(self):
+        exporter = self._project.get_item(self._exporter_name)
+        exporter.set_max_kept_runs(self._previous_value)
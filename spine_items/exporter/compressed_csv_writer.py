@@ -0,0 +1,71 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains a .csv writer that streams compressed output."""
+
+import csv
+import gzip
+import os
+import os.path
+from spinedb_api.spine_io.exporters.csv_writer import CsvWriter
+from spinedb_api.spine_io.exporters.writer import WriterException
+from .specification import OutputCompression
+
+
+class CompressedCsvWriter(CsvWriter):
+    """A .csv writer that compresses the output files on the fly."""
+
+    def __init__(self, path, backup_file_name, compression):
+        """
+        Args:
+            path (Path or str): path to output directory
+            backup_file_name (str): output file name if no table name is provided by the mappings
+            compression (OutputCompression): output compression
+        """
+        super().__init__(path, backup_file_name)
+        self._compression = compression
+
+    def start_table(self, table_name, title_key):
+        """See base class."""
+        if table_name is None:
+            table_name = self._default_table_name
+        else:
+            table_name = table_name + ".csv." + self._compression.file_extension()
+        self._file_name = os.path.join(self._path, table_name)
+        if self._file_name not in self._finished_files and os.path.exists(self._file_name):
+            os.remove(self._file_name)
+        self._file = open_compressed_text(self._file_name, self._compression)
+        self._out = csv.writer(self._file)
+        return True
+
+
+def open_compressed_text(file_name, compression):
+    """Opens a compressed file for appending text.
+
+    Appending to an existing file adds a new gzip member or zstd frame which readers concatenate transparently.
+
+    Args:
+        file_name (str): path to file
+        compression (OutputCompression): compression
+
+    Returns:
+        TextIO: file-like object
+    """
+    if compression == OutputCompression.GZIP:
+        return gzip.open(file_name, "at", newline="", encoding="utf-8")
+    if compression == OutputCompression.ZSTD:
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise WriterException("zstd compression requires the zstandard package.") from error
+        return zstandard.open(file_name, "at", newline="", encoding="utf-8")
+    raise WriterException(f"Unsupported compression {compression.value}.")
@@ -15,7 +15,9 @@
 from datetime import datetime
 import os
 from pathlib import Path
-from time import time
+import shutil
+import tempfile
+from time import perf_counter, time
 from spine_engine.logger_interface import LoggerInterface
 from spine_engine.utils.helpers import write_filter_id_file
 from spinedb_api import DatabaseMapping, SpineDBAPIError
@@ -25,7 +27,17 @@ from spinedb_api.spine_io.exporters.gdx_writer import GdxWriter
 from spinedb_api.spine_io.exporters.sql_writer import SqlWriter
 from spinedb_api.spine_io.exporters.writer import WriterException, write
 from ..utils import UrlDict, convert_to_sqlalchemy_url, split_url_credentials
-from .specification import OutputFormat, Specification
+from .arrow_writers import ArrowIpcWriter, ParquetWriter
+from .bulk_sql_writer import BulkSqlWriter
+from .compressed_csv_writer import CompressedCsvWriter
+from .output_files import (
+    RUN_DIRECTORY_TAG,
+    link_to_identical_earlier_output,
+    move_into_place,
+    prune_run_directories,
+    run_directories,
+)
+from .specification import OutputCompression, OutputFormat, Specification, split_compression_extension
 
 
 def do_work(
@@ -40,6 +52,7 @@ def do_work(
     filter_id,
     filter_subdirectory,
     logger,
+    max_kept_runs=0,
 ):
     """
     Exports databases using given specification as export mapping.
@@ -56,6 +69,7 @@ def do_work(
         filter_id (str): filter id
         filter_subdirectory (str): name of extra subdirectory used when filters have been applied
         logger (LoggerInterface): a logger
+        max_kept_runs (int): number of time stamped runs to keep in output directory; 0 keeps all
 
     Returns:
         tuple: boolean success flag, dictionary of output files
@@ -93,6 +107,7 @@ def do_work(
                     filter_id,
                     filter_subdirectory,
                     logger,
+                    max_kept_runs,
                 )
             if not successful:
                 return False, written_files
@@ -114,9 +129,15 @@ def _export_to_file(
     filter_id,
     filter_subdirectory,
     logger,
+    max_kept_runs=0,
 ):
     """Exports into file(s) including a new SQLite file.
 
+    Files are written into a staging directory first and moved into place once writing has succeeded.
+    When time stamped output directories are used,
+    files identical to the previous run's outputs are hard linked to them
+    and run directories beyond ``max_kept_runs`` are removed.
+
     Args:
         database_map (DatabaseMapping): source database map
         specification (Specification): export specification dictionary
@@ -130,33 +151,41 @@ def _export_to_file(
         filter_id (str): filter id
         filter_subdirectory (str): name of extra subdirectory used when filters have been applied
         logger (LoggerInterface): a logger
+        max_kept_runs (int): number of time stamped runs to keep; 0 keeps all
 
     Returns:
         bool: True if operation was successful, False otherwise
     """
-    output_file_name = _add_extension(output_label, specification.output_format)
+    compression = specification.effective_compression()
+    output_file_name = _add_extension(output_label, specification.output_format, compression)
     out_path = _subdirectory_for_fork(output_file_name, out_dir, output_time_stamps, filter_subdirectory)
+    output_dir = Path(out_path).parent
+    staging_dir = None
     try:
-        file = Path(out_path)
-        file.parent.mkdir(parents=True, exist_ok=True)
-        if file.exists():
-            file.unlink()
-        writer = make_writer(specification.output_format, out_path, gams_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=output_dir))
+        staging_path = str(staging_dir / output_file_name)
+        writer = make_writer(
+            specification.output_format, staging_path, gams_path, compression, specification.bulk_insert_batch_size
+        )
         specifications = specification.enabled_specifications().values()
         mappings = (m.root for m in specifications)
         header_always = (m.always_export_header for m in specifications)
         group_fns = (m.group_fn for m in specifications)
         write(database_map, writer, *mappings, empty_data_header=header_always, group_fns=group_fns)
+        if specification.output_format.is_multi_file_capable():
+            staged_files = writer.output_files()
+        else:
+            staged_files = {staging_path}
+        files = move_into_place(staged_files, output_dir)
     except (FileNotFoundError, PermissionError, WriterException) as e:
         logger.msg_error.emit(str(e))
         if cancel_on_error:
             return False
         successes.append(False)
     else:
-        if isinstance(writer, CsvWriter):
-            files = writer.output_files()
-        else:
-            files = {out_path}
+        if output_time_stamps:
+            _deduplicate_and_prune(output_dir, files, filter_subdirectory, max_kept_runs)
         written_files[output_label] = files
         if len(files) > 1:
             anchors = []
@@ -168,11 +197,31 @@ def _export_to_file(
             file_anchor = f"<a title='{only_file}' href='file:///{only_file}'>{only_file.name}</a>"
             logger.msg_success.emit(f"Wrote {file_anchor}")
         if filter_id:
-            write_filter_id_file(filter_id, Path(out_path).parent)
+            write_filter_id_file(filter_id, output_dir)
         successes.append(True)
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
     return True
 
 
+def _deduplicate_and_prune(run_dir, files, filter_id_hash, max_kept_runs):
+    """Links written files to identical outputs of earlier runs and removes obsolete run directories.
+
+    Args:
+        run_dir (Path): current run's output directory
+        files (Iterable of str): written files
+        filter_id_hash (str): hashed filter id
+        max_kept_runs (int): number of runs to keep; 0 keeps all
+    """
+    out_dir = run_dir.parent
+    prefix = _run_directory_prefix(filter_id_hash)
+    earlier_run_dirs = [path for path in run_directories(out_dir, prefix) if path.name < run_dir.name]
+    for file in files:
+        link_to_identical_earlier_output(Path(file), earlier_run_dirs)
+    prune_run_directories(out_dir, prefix, max_kept_runs)
+
+
 def _export_to_database(
     database_map: DatabaseMapping,
     specification: Specification,
@@ -198,24 +247,63 @@ def _export_to_database(
     if url is None:
         return True
     try:
-        writer = SqlWriter(url.render_as_string(hide_password=False), overwrite_existing=False)
+        writer = _make_sql_writer(
+            url.render_as_string(hide_password=False), False, specification.bulk_insert_batch_size
+        )
         specifications = specification.enabled_specifications().values()
         mappings = (m.root for m in specifications)
         header_always = (m.always_export_header for m in specifications)
         group_fns = (m.group_fn for m in specifications)
+        start_time = perf_counter()
         write(database_map, writer, *mappings, empty_data_header=header_always, group_fns=group_fns)
+        duration = perf_counter() - start_time
     except WriterException as e:
         logger.msg_error.emit(str(e))
         if cancel_on_error:
             return False
         successes.append(False)
     else:
-        logger.msg_success.emit("Wrote to database.")
+        if isinstance(writer, BulkSqlWriter):
+            logger.msg_success.emit(
+                f"Wrote {writer.row_count} rows to database in {duration:.1f} s"
+                f" ({_rows_per_second(writer.row_count, duration):.0f} rows/s)."
+            )
+        else:
+            logger.msg_success.emit("Wrote to database.")
         successes.append(True)
     return True
 
 
-def make_writer(output_format, out_path, gams_path):
+def _make_sql_writer(database, overwrite_existing, bulk_insert_batch_size):
+    """Constructs an SQL writer.
+
+    Args:
+        database (str): URL or path to output .sqlite file
+        overwrite_existing (bool): if True, overwrites existing tables, otherwise appends to them
+        bulk_insert_batch_size (int): rows per insert in bulk-load mode; 0 uses the row by row writer
+
+    Returns:
+        SqlWriter: a writer
+    """
+    if bulk_insert_batch_size > 0:
+        return BulkSqlWriter(database, overwrite_existing, bulk_insert_batch_size)
+    return SqlWriter(database, overwrite_existing=overwrite_existing)
+
+
+def _rows_per_second(row_count, duration):
+    """Calculates write rate.
+
+    Args:
+        row_count (int): number of rows written
+        duration (float): duration in seconds
+
+    Returns:
+        float: rows per second
+    """
+    return row_count / duration if duration > 0.0 else 0.0
+
+
+def make_writer(output_format, out_path, gams_path, compression=OutputCompression.NONE, bulk_insert_batch_size=0):
     """
     Constructs a writer.
 
@@ -223,30 +311,44 @@ def make_writer(output_format, out_path, gams_path):
         output_format (OutputFormat): output format
         out_path (str): path to output file
         gams_path (str): path to GAMS installation
+        compression (OutputCompression): output compression for compressible formats
+        bulk_insert_batch_size (int): rows per insert in SQL bulk-load mode; 0 disables bulk loading
 
     Returns:
         Writer: a writer
     """
     if output_format == OutputFormat.CSV:
         path = Path(out_path)
+        if compression != OutputCompression.NONE:
+            return CompressedCsvWriter(path.parent, path.name, compression)
         return CsvWriter(path.parent, path.name)
     if output_format == OutputFormat.EXCEL:
         return ExcelWriter(out_path)
     if output_format == OutputFormat.SQL:
-        return SqlWriter(out_path, overwrite_existing=True)
+        return _make_sql_writer(out_path, True, bulk_insert_batch_size)
+    if output_format == OutputFormat.PARQUET:
+        path = Path(out_path)
+        return ParquetWriter(path.parent, path.name)
+    if output_format == OutputFormat.ARROW:
+        path = Path(out_path)
+        return ArrowIpcWriter(path.parent, path.name)
     return GdxWriter(out_path, gams_path)
 
 
-def _add_extension(label, file_format):
-    """Adds file format dependent extension to ``label`` if it is missing one.
+def _add_extension(label, file_format, compression=OutputCompression.NONE):
+    """Adds file format and compression dependent extensions to ``label`` if it is missing them.
 
     Args:
         label (str): label to add the extension to
         file_format (OutputFormat): file format
+        compression (OutputCompression): output compression
 
     Returns:
         str: file name
     """
+    if compression != OutputCompression.NONE:
+        label, _ = split_compression_extension(label)
+        return _add_extension(label, file_format) + "." + compression.file_extension()
     name, _, label_extension = label.rpartition(".")
     if name and file_format.is_compatible_file_extension(label_extension):
         return label
@@ -268,14 +370,18 @@ def _subdirectory_for_fork(output_file_name, data_dir, output_time_stamps, filte
     """
     if output_time_stamps:
         stamp = datetime.fromtimestamp(time())
-        time_stamp = "run@" + stamp.isoformat(timespec="seconds").replace(":", ".")
-    else:
-        time_stamp = ""
-    if filter_id_hash:
-        if time_stamp:
-            path = os.path.join(data_dir, filter_id_hash + "_" + time_stamp, output_file_name)
-        else:
-            path = os.path.join(data_dir, filter_id_hash, output_file_name)
-    else:
-        path = os.path.join(data_dir, time_stamp, output_file_name)
-    return path
+        time_stamp = RUN_DIRECTORY_TAG + stamp.isoformat(timespec="seconds").replace(":", ".")
+        return os.path.join(data_dir, _run_directory_prefix(filter_id_hash) + time_stamp, output_file_name)
+    return os.path.join(data_dir, filter_id_hash, output_file_name)
+
+
+def _run_directory_prefix(filter_id_hash):
+    """Returns the name prefix of time stamped run directories.
+
+    Args:
+        filter_id_hash (str): hashed filter id
+
+    Returns:
+        str: prefix
+    """
+    return filter_id_hash + "_" if filter_id_hash else ""
@@ -34,7 +34,16 @@ from .utils import EXPORTER_EXECUTION_MANIFEST_FILE_PREFIX, Database, output_dat
 
 class ExecutableItem(ExecutableItemBase):
     def __init__(
-        self, name, specification, output_channels, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+        self,
+        name,
+        specification,
+        output_channels,
+        output_time_stamps,
+        cancel_on_error,
+        gams_path,
+        project_dir,
+        logger,
+        max_kept_runs=0,
     ):
         """
         Args:
@@ -46,10 +55,12 @@ class ExecutableItem(ExecutableItemBase):
             gams_path (str): GAMS path from Toolbox settings
             project_dir (str): absolute path to project directory
             logger (LoggerInterface): a logger
+            max_kept_runs (int): number of time stamped output directories to keep; 0 keeps all
         """
         super().__init__(name, project_dir, logger)
         self._output_time_stamps = output_time_stamps
         self._cancel_on_error = cancel_on_error
+        self._max_kept_runs = max_kept_runs
         self._gams_path = gams_path
         self._forks = {}
         self._result_files = {}
@@ -167,6 +178,7 @@ class ExecutableItem(ExecutableItemBase):
                 self._filter_id,
                 generate_filter_subdirectory_name(forward_resources, self.hash_filter_id()),
                 self._logger,
+                self._max_kept_runs,
             ),
         )
         result = self._process.run_until_complete()
@@ -246,7 +258,16 @@ class ExecutableItem(ExecutableItemBase):
                     channel.out_url.update(credentials)
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
+        max_kept_runs = item_dict.get("max_kept_runs", 0)
         gams_path = app_settings.value("appSettings/gamsPath", defaultValue=None)
         return ExecutableItem(
-            name, specification, output_channels, output_time_stamps, cancel_on_error, gams_path, project_dir, logger
+            name,
+            specification,
+            output_channels,
+            output_time_stamps,
+            cancel_on_error,
+            gams_path,
+            project_dir,
+            logger,
+            max_kept_runs,
         )
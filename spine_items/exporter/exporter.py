@@ -23,13 +23,13 @@ from spinedb_api import clear_filter_configs
 from spinetoolbox.helpers import SealCommand
 from spinetoolbox.project_item.project_item import ProjectItem
 from ..commands import UpdateCancelOnErrorCommand
-from .commands import CommandId, UpdateOutLabel, UpdateOutputTimeStampsFlag, UpdateOutUrl
+from .commands import CommandId, UpdateMaxKeptRuns, UpdateOutLabel, UpdateOutputTimeStampsFlag, UpdateOutUrl
 from .executable_item import ExecutableItem
 from .export_manifest import exported_files_as_resources, is_manifest_file
 from .item_info import ItemInfo
 from .mvcmodels.full_url_list_model import FullUrlListModel
 from .output_channel import OutputChannel
-from .specification import OutputFormat
+from .specification import OutputCompression, OutputFormat, split_compression_extension
 from .utils import output_database_resources
 from .widgets.export_list_item import ExportListItem
 
@@ -59,6 +59,7 @@ class Exporter(ProjectItem):
         output_channels=None,
         output_time_stamps=False,
         cancel_on_error=True,
+        max_kept_runs=0,
     ):
         """
         Args:
@@ -72,11 +73,13 @@ class Exporter(ProjectItem):
             output_channels (list of OutputChannel, optional): input and output labels
             output_time_stamps (bool): True to include time stamps to output directory names
             cancel_on_error (bool): True to fail execution in case of non-fatal errors
+            max_kept_runs (int): number of time stamped output directories to keep; 0 keeps all
         """
         super().__init__(name, description, x, y, project)
         self._toolbox = toolbox
         self._append_output_time_stamps = output_time_stamps
         self._cancel_on_error = cancel_on_error
+        self._max_kept_runs = max_kept_runs
         self._output_filenames = {}
         self._export_list_items = {}
         self._full_url_model = FullUrlListModel()
@@ -164,19 +167,25 @@ class Exporter(ProjectItem):
         self._properties_ui.cancel_on_error_check_box.setCheckState(
             Qt.CheckState.Checked if self._cancel_on_error else Qt.CheckState.Unchecked
         )
+        self._properties_ui.max_kept_runs_spin_box.setValue(self._max_kept_runs)
+        self._properties_ui.max_kept_runs_spin_box.setEnabled(self._append_output_time_stamps)
 
     def _set_properties_message(self):
         if self._specification is None:
             message = ""
         else:
+            output_format = self._specification.output_format.value
+            compression = self._specification.effective_compression()
+            if compression != OutputCompression.NONE:
+                output_format += f" ({compression.value} compressed)"
             if self._specification.is_exporting_multiple_files():
                 message = (
-                    f"Currently exporting multiple files in {self._specification.output_format.value} format."
+                    f"Currently exporting multiple files in {output_format} format."
                     " The file names are given by the specification."
                 )
             else:
                 message = (
-                    f"Currently exporting in {self._specification.output_format.value} format."
+                    f"Currently exporting in {output_format} format."
                     " The Output labels below are treated as file names."
                 )
         self._properties_ui.message_label.setText(message)
@@ -265,7 +274,8 @@ class Exporter(ProjectItem):
             return
         output_formats = set()
         for channel in self._output_channels:
-            _, separator, extension = channel.out_label.rpartition(".")
+            out_label, _ = split_compression_extension(channel.out_label)
+            _, separator, extension = out_label.rpartition(".")
             if not separator:
                 continue
             output_format = OutputFormat.output_format_from_extension(extension)
@@ -381,6 +391,7 @@ class Exporter(ProjectItem):
         serialized = super().item_dict()
         serialized["output_time_stamps"] = self._append_output_time_stamps
         serialized["cancel_on_error"] = self._cancel_on_error
+        serialized["max_kept_runs"] = self._max_kept_runs
         serialized["output_labels"] = sorted(
             [c.to_dict(self._project) for c in self._output_channels], key=itemgetter("in_label")
         )
@@ -427,6 +438,7 @@ class Exporter(ProjectItem):
                     channel.out_url.update(credentials)
         output_time_stamps = item_dict.get("output_time_stamps", False)
         cancel_on_error = item_dict.get("cancel_on_error", True)
+        max_kept_runs = item_dict.get("max_kept_runs", 0)
         specification_name = item_dict.get("specification", "")
         specification = project.get_specification(specification_name)
         if specification_name and not specification:
@@ -442,6 +454,7 @@ class Exporter(ProjectItem):
             output_channels,
             output_time_stamps,
             cancel_on_error,
+            max_kept_runs,
         )
 
     def rename(self, new_name, rename_data_dir_message):
@@ -472,6 +485,7 @@ class Exporter(ProjectItem):
         s = super().make_signal_handler_dict()
         s[self._properties_ui.output_time_stamps_check_box.stateChanged] = self._change_output_time_stamps_flag
         s[self._properties_ui.cancel_on_error_check_box.stateChanged] = self._cancel_on_error_option_changed
+        s[self._properties_ui.max_kept_runs_spin_box.valueChanged] = self._change_max_kept_runs
         s[self._properties_ui.specification_button.clicked] = self.show_specification_window
         s[self._properties_ui.specification_combo_box.textActivated] = self._change_specification
         return s
@@ -499,6 +513,30 @@ class Exporter(ProjectItem):
         self._append_output_time_stamps = flag
         if self._active:
             self._properties_ui.output_time_stamps_check_box.setChecked(flag)
+            self._properties_ui.max_kept_runs_spin_box.setEnabled(flag)
+
+    @Slot(int)
+    def _change_max_kept_runs(self, value):
+        """
+        Pushes a command that changes the number of kept time stamped runs.
+
+        Args:
+            value (int): setting's new value
+        """
+        if value == self._max_kept_runs:
+            return
+        self._toolbox.undo_stack.push(UpdateMaxKeptRuns(self.name, value, self._max_kept_runs, self._project))
+
+    def set_max_kept_runs(self, value):
+        """
+        Sets the number of time stamped output directories to keep.
+
+        Args:
+            value (int): number of runs to keep; 0 keeps all
+        """
+        self._max_kept_runs = value
+        if self._active:
+            self._properties_ui.max_kept_runs_spin_box.setValue(value)
 
     def _check_missing_specification(self):
         """Checks specification's status."""
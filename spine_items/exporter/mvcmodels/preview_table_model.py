@@ -22,6 +22,7 @@ class PreviewTableModel(QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self._table = []
+        self._column_count = 0
         self._mapping_name = None
         self._table_name = None
         self._row_to_map_color = {}
@@ -35,13 +36,41 @@ class PreviewTableModel(QAbstractTableModel):
         if not self._table:
             return
         self.beginResetModel()
-        self._table.clear()
+        self._table = []
+        self._column_count = 0
         self.endResetModel()
 
+    def append_rows(self, rows):
+        """Appends rows to the table.
+
+        Args:
+            rows (list of list): rows to append
+        """
+        if not rows:
+            return
+        column_count = max(self._column_count, self._count_columns(rows))
+        if column_count > self._column_count:
+            self.beginInsertColumns(QModelIndex(), self._column_count, column_count - 1)
+            self._column_count = column_count
+            self.endInsertColumns()
+        first = len(self._table)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._table.extend(rows)
+        self.endInsertRows()
+
     def columnCount(self, parent=QModelIndex()):
-        if not self._table:
-            return 0
-        return min(max(len(row) for row in self._table), self.MAX_COLUMNS)
+        return self._column_count
+
+    def _count_columns(self, rows):
+        """Counts the number of visible columns in given rows.
+
+        Args:
+            rows (list of list): table rows
+
+        Returns:
+            int: column count
+        """
+        return min(max((len(row) for row in rows), default=0), self.MAX_COLUMNS)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
@@ -93,7 +122,8 @@ class PreviewTableModel(QAbstractTableModel):
         self.beginResetModel()
         self._mapping_name = mapping_name
         self._table_name = table_name
-        self._table = table
+        self._table = list(table)
+        self._column_count = self._count_columns(self._table)
         self._reset_colors(mapping_colors)
         self.endResetModel()
 
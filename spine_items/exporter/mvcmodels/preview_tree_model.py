@@ -14,11 +14,15 @@
 
 from itertools import takewhile
 from operator import methodcaller
-from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal
+
+ANONYMOUS_TABLE_NAME = "<anonymous table>"
 
 
 class PreviewTreeModel(QAbstractItemModel):
     TABLE_ROLE = Qt.ItemDataRole.UserRole + 1
+    rows_appended = Signal(str, str, list)
+    """Emitted with mapping name, table name and new rows after rows have been appended to a table."""
 
     def __init__(self):
         super().__init__()
@@ -34,42 +38,92 @@ class PreviewTreeModel(QAbstractItemModel):
             mapping_name (str): mapping's name
             tables (dict): mapping from table name to table data
         """
-        if None in tables:
-            tables["<anonymous table>"] = tables.pop(None)
-        if mapping_name not in self._tables:
-            new_names = list(self._mapping_names)
-            new_names.append(mapping_name)
-            new_names.sort(key=methodcaller("lower"))
-            row = len(list(takewhile(lambda x: x[0] == x[1], zip(new_names, self._mapping_names))))
-            self.beginInsertRows(QModelIndex(), row, row)
-            self._tables[mapping_name] = {}
-            self._mapping_names = new_names
-            self._table_names[mapping_name] = []
-            self.endInsertRows()
+        self.remove_tables_except(mapping_name, tables)
+        for name, table in tables.items():
+            self.set_table(mapping_name, name, table)
+
+    def set_table(self, mapping_name, table_name, table):
+        """
+        Adds a new table or replaces an existing table's data.
+
+        Args:
+            mapping_name (str): mapping's name
+            table_name (str, optional): table's name
+            table (list of list): table data
+        """
+        table_name = _table_name(table_name)
+        self._ensure_mapping(mapping_name)
+        parent_index = self.index(self._mapping_names.index(mapping_name), 0)
+        if table_name in self._tables[mapping_name]:
+            self._tables[mapping_name][table_name] = table
+            row = self._table_names[mapping_name].index(table_name)
+            index = self.index(row, 0, parent_index)
+            self.dataChanged.emit(index, index, [self.TABLE_ROLE])
+            return
+        self._tables[mapping_name][table_name] = table
+        new_names = list(self._table_names[mapping_name])
+        new_names.append(table_name)
+        new_names.sort(key=methodcaller("lower"))
+        row = len(list(takewhile(lambda x: x[0] == x[1], zip(new_names, self._table_names[mapping_name]))))
+        self.beginInsertRows(parent_index, row, row)
+        self._table_names[mapping_name] = new_names
+        self.endInsertRows()
+
+    def append_rows(self, mapping_name, table_name, rows):
+        """
+        Appends rows to a table adding the table if it does not exist.
+
+        Args:
+            mapping_name (str): mapping's name
+            table_name (str, optional): table's name
+            rows (list of list): rows to append
+        """
+        table_name = _table_name(table_name)
+        table = self._tables.get(mapping_name, {}).get(table_name)
+        if table is None:
+            self.set_table(mapping_name, table_name, rows)
+            return
+        table.extend(rows)
+        self.rows_appended.emit(mapping_name, table_name, rows)
+
+    def remove_tables_except(self, mapping_name, table_names):
+        """
+        Removes mapping's tables that are not listed.
+
+        Args:
+            mapping_name (str): mapping's name
+            table_names (Iterable of str): names of tables to keep
+        """
+        self._ensure_mapping(mapping_name)
+        kept_names = {_table_name(name) for name in table_names}
         parent_index = self.index(self._mapping_names.index(mapping_name), 0)
         for old_name in list(self._tables[mapping_name]):
-            if old_name not in tables:
+            if old_name not in kept_names:
                 names = self._table_names[mapping_name]
                 row = names.index(old_name)
                 self.beginRemoveRows(parent_index, row, row)
                 del self._tables[mapping_name][old_name]
                 self._table_names[mapping_name] = names[:row] + names[row + 1 :]
                 self.endRemoveRows()
-        for name, table in tables.items():
-            if name in self._tables[mapping_name]:
-                self._tables[mapping_name][name] = table
-                row = self._table_names[mapping_name].index(name)
-                index = self.index(row, 0, parent_index)
-                self.dataChanged.emit(index, index, [self.TABLE_ROLE])
-            else:
-                self._tables[mapping_name][name] = table
-                new_names = list(self._table_names[mapping_name])
-                new_names.append(name)
-                new_names.sort(key=methodcaller("lower"))
-                row = len(list(takewhile(lambda x: x[0] == x[1], zip(new_names, self._table_names[mapping_name]))))
-                self.beginInsertRows(parent_index, row, row)
-                self._table_names[mapping_name] = new_names
-                self.endInsertRows()
+
+    def _ensure_mapping(self, mapping_name):
+        """
+        Adds a mapping to the model if it does not exist.
+
+        Args:
+            mapping_name (str): mapping's name
+        """
+        if mapping_name in self._tables:
+            return
+        new_names = list(self._mapping_names)
+        new_names.append(mapping_name)
+        new_names.sort(key=methodcaller("lower"))
+        row = len(list(takewhile(lambda x: x[0] == x[1], zip(new_names, self._mapping_names))))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tables[mapping_name] = {}
+        self._mapping_names = new_names
+        self._table_names[mapping_name] = []
+        self.endInsertRows()
 
     def columnCount(self, parent=QModelIndex()):
         return 1
@@ -186,3 +240,15 @@ class PreviewTreeModel(QAbstractItemModel):
             return len(self._mapping_names)
         mapping_name = self._mapping_names[parent.row()]
         return len(self._table_names[mapping_name])
+
+
+def _table_name(name):
+    """Replaces missing table name by a placeholder.
+
+    Args:
+        name (str, optional): table name
+
+    Returns:
+        str: table name
+    """
+    return name if name is not None else ANONYMOUS_TABLE_NAME
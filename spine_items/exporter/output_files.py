@@ -0,0 +1,135 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Utilities to manage Exporter's output files across executions."""
+
+from __future__ import annotations
+from collections.abc import Iterable
+import hashlib
+import os
+from pathlib import Path
+import shutil
+
+RUN_DIRECTORY_TAG = "run@"
+"""Marks time stamped output directories."""
+_CHUNK_SIZE = 1024 * 1024
+
+
+def move_into_place(files: Iterable[str], target_dir: Path) -> set[str]:
+    """Atomically moves files written into a staging directory into target directory.
+
+    Existing files in target directory are replaced.
+
+    Args:
+        files: paths to files in staging directory
+        target_dir: final output directory
+
+    Returns:
+        paths to moved files
+    """
+    moved_files = set()
+    for file in files:
+        target = target_dir / Path(file).name
+        os.replace(file, target)
+        moved_files.add(str(target))
+    return moved_files
+
+
+def file_digest(path: Path) -> str:
+    """Calculates SHA-256 digest of file's contents.
+
+    Args:
+        path: path to file
+
+    Returns:
+        hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as input_file:
+        while chunk := input_file.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_directories(out_dir: Path, prefix: str) -> list[Path]:
+    """Lists time stamped run directories in chronological order.
+
+    Args:
+        out_dir: Exporter's output directory
+        prefix: run directory name prefix, e.g. filter id hash followed by an underscore
+
+    Returns:
+        run directories
+    """
+    if not out_dir.is_dir():
+        return []
+    run_prefix = prefix + RUN_DIRECTORY_TAG
+    return sorted(path for path in out_dir.iterdir() if path.is_dir() and path.name.startswith(run_prefix))
+
+
+def link_to_identical_earlier_output(file_path: Path, earlier_run_dirs: Iterable[Path]) -> bool:
+    """Replaces a freshly written file by a hard link to an identical file from an earlier run.
+
+    Only the latest earlier run that contains a file with the same name is compared.
+    Since outputs are never modified after they have been written,
+    sharing the data between runs is safe.
+
+    Args:
+        file_path: path to freshly written file
+        earlier_run_dirs: earlier run directories in chronological order
+
+    Returns:
+        True if file was replaced by a link, False otherwise
+    """
+    for run_dir in reversed(list(earlier_run_dirs)):
+        candidate = run_dir / file_path.name
+        if candidate.is_file():
+            break
+    else:
+        return False
+    try:
+        if os.path.samefile(candidate, file_path):
+            return True
+        if candidate.stat().st_size != file_path.stat().st_size:
+            return False
+        if file_digest(candidate) != file_digest(file_path):
+            return False
+        temp_link = file_path.with_name(file_path.name + ".link")
+        os.link(candidate, temp_link)
+        try:
+            os.replace(temp_link, file_path)
+        except OSError:
+            temp_link.unlink()
+            raise
+    except OSError:
+        # File system may not support hard links; keep the copy.
+        return False
+    return True
+
+
+def prune_run_directories(out_dir: Path, prefix: str, max_kept_runs: int) -> list[Path]:
+    """Removes oldest run directories so that at most given number of runs remain.
+
+    Args:
+        out_dir: Exporter's output directory
+        prefix: run directory name prefix
+        max_kept_runs: number of most recent runs to keep; 0 keeps all
+
+    Returns:
+        removed directories
+    """
+    if max_kept_runs < 1:
+        return []
+    obsolete = run_directories(out_dir, prefix)[:-max_kept_runs]
+    for run_dir in obsolete:
+        shutil.rmtree(run_dir, ignore_errors=True)
+    return obsolete
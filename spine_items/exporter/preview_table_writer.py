@@ -15,18 +15,32 @@
 import numpy
 from spinedb_api.spine_io.exporters.writer import Writer
 
+CANCELLATION_CHECK_INTERVAL = 100
+"""Number of rows written between checks whether writing should continue."""
+DEFAULT_CHUNK_SIZE = 100
+"""Number of rows in a streamed preview chunk."""
+
 
 class TableWriter(Writer):
     """An export writer that writes to a Python dictionary."""
 
-    def __init__(self):
+    def __init__(self, keep_writing=None):
+        """
+        Args:
+            keep_writing (Callable, optional): function that returns False when writing should be aborted
+        """
         self._tables = {}
         self._current_table = None
+        self._keep_writing = keep_writing
+        self._rows_since_check = 0
+        self._cancelled = False
 
     def finish_table(self):
         self._current_table = None
 
     def start_table(self, table_name, title_key):
+        if self._check_cancellation():
+            return False
         self._current_table = self._tables.setdefault(table_name, [])
         return True
 
@@ -35,10 +49,81 @@ class TableWriter(Writer):
         """A dictionary containing the tables."""
         return self._tables
 
+    @property
+    def cancelled(self):
+        """True if writing was aborted."""
+        return self._cancelled
+
     def write_row(self, row):
-        self._current_table.append([_sanitize(cell) for cell in row])
+        self._store_row([_sanitize(cell) for cell in row])
+        self._rows_since_check += 1
+        if self._rows_since_check == CANCELLATION_CHECK_INTERVAL:
+            return not self._check_cancellation()
         return True
 
+    def _store_row(self, row):
+        """Stores a sanitized row.
+
+        Args:
+            row (list): row to store
+        """
+        self._current_table.append(row)
+
+    def _check_cancellation(self):
+        """Asks the keep writing callback whether to continue.
+
+        Returns:
+            bool: True if writing should be aborted
+        """
+        self._rows_since_check = 0
+        if self._keep_writing is not None and not self._cancelled:
+            self._cancelled = not self._keep_writing()
+        return self._cancelled
+
+
+class StreamingTableWriter(TableWriter):
+    """A table writer that passes rows forward in chunks instead of collecting whole tables."""
+
+    def __init__(self, send_chunk, keep_writing=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            send_chunk (Callable): function that receives a dictionary from table name to new rows
+            keep_writing (Callable, optional): function that returns False when writing should be aborted
+            chunk_size (int): maximum number of rows in a chunk
+        """
+        super().__init__(keep_writing)
+        self._send_chunk = send_chunk
+        self._chunk_size = chunk_size
+        self._current_table_name = None
+        self._sent_table_names = set()
+
+    def finish_table(self):
+        if (
+            self._current_table is not None
+            and not self._cancelled
+            and (self._current_table or self._current_table_name not in self._sent_table_names)
+        ):
+            self._flush()
+        super().finish_table()
+
+    def start_table(self, table_name, title_key):
+        if self._check_cancellation():
+            return False
+        self._current_table_name = table_name
+        self._current_table = []
+        return True
+
+    def _store_row(self, row):
+        self._current_table.append(row)
+        if len(self._current_table) == self._chunk_size:
+            self._flush()
+
+    def _flush(self):
+        """Sends buffered rows of current table."""
+        self._send_chunk({self._current_table_name: self._current_table})
+        self._sent_table_names.add(self._current_table_name)
+        self._current_table = []
+
 
 def _sanitize(x):
     """Converts special parameter value types to strings.
@@ -74,6 +74,8 @@ class OutputFormat(Enum):
     EXCEL = "Excel"
     GDX = "gdx"
     SQL = "SQL"
+    PARQUET = "Parquet"
+    ARROW = "Arrow IPC"
 
     def is_compatible_file_extension(self, extension):
         """Tests if given file extension is acceptable for current output format.
@@ -89,6 +91,10 @@ class OutputFormat(Enum):
             return extension == "gdx"
         if self == OutputFormat.SQL:
             return extension in ("sqlite", "sqlite3")
+        if self == OutputFormat.PARQUET:
+            return extension == "parquet"
+        if self == OutputFormat.ARROW:
+            return extension in ("arrow", "feather")
         return False
 
     def file_extension(self):
@@ -102,6 +108,8 @@ class OutputFormat(Enum):
             OutputFormat.EXCEL: "xlsx",
             OutputFormat.GDX: "gdx",
             OutputFormat.SQL: "sqlite",
+            OutputFormat.PARQUET: "parquet",
+            OutputFormat.ARROW: "arrow",
         }[self]
 
     @staticmethod
@@ -116,9 +124,12 @@ class OutputFormat(Enum):
         """
         try:
             return {
+                "arrow": OutputFormat.ARROW,
                 "csv": OutputFormat.CSV,
                 "dat": OutputFormat.CSV,
+                "feather": OutputFormat.ARROW,
                 "gdx": OutputFormat.GDX,
+                "parquet": OutputFormat.PARQUET,
                 "sqlite": OutputFormat.SQL,
                 "txt": OutputFormat.CSV,
                 "xlsx": OutputFormat.EXCEL,
@@ -141,9 +152,80 @@ class OutputFormat(Enum):
         Returns:
             bool: True if multiple output files are possible, False otherwise
         """
+        return self in (OutputFormat.CSV, OutputFormat.PARQUET, OutputFormat.ARROW)
+
+    def is_compressible(self):
+        """Tests if the output format supports output compression.
+
+        Returns:
+            bool: True if output files can be compressed, False otherwise
+        """
         return self == OutputFormat.CSV
 
 
+@unique
+class OutputCompression(Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    def file_extension(self):
+        """Returns a file extension for the compression.
+
+        Returns:
+            str: file extension without the dot or empty string if there is no compression
+        """
+        return {
+            OutputCompression.NONE: "",
+            OutputCompression.GZIP: "gz",
+            OutputCompression.ZSTD: "zst",
+        }[self]
+
+    @staticmethod
+    def compression_from_extension(extension):
+        """Creates compression from given file extension.
+
+        Args:
+            extension (str): file extension without the dot
+
+        Returns:
+            OutputCompression: compression or None if extension is not a compression extension
+        """
+        try:
+            return {
+                "gz": OutputCompression.GZIP,
+                "zst": OutputCompression.ZSTD,
+            }[extension]
+        except KeyError:
+            return None
+
+    @staticmethod
+    def default():
+        """Return the default compression.
+
+        Returns:
+            OutputCompression: default compression
+        """
+        return OutputCompression.NONE
+
+
+def split_compression_extension(file_name):
+    """Strips compression extension from given file name.
+
+    Args:
+        file_name (str): file name
+
+    Returns:
+        tuple: file name without compression extension and compression
+    """
+    name, separator, extension = file_name.rpartition(".")
+    if separator and name:
+        compression = OutputCompression.compression_from_extension(extension)
+        if compression is not None:
+            return name, compression
+    return file_name, OutputCompression.NONE
+
+
 @dataclass(eq=False)
 class MappingSpecification:
     type: MappingType
@@ -182,19 +264,31 @@ class MappingSpecification:
 class Specification(ProjectItemSpecification):
     """Exporter's specification."""
 
-    def __init__(self, name="", description="", mapping_specifications=None, output_format=OutputFormat.default()):
+    def __init__(
+        self,
+        name="",
+        description="",
+        mapping_specifications=None,
+        output_format=OutputFormat.default(),
+        compression=OutputCompression.default(),
+        bulk_insert_batch_size=0,
+    ):
         """
         Args:
             name (str): specification name
             description (str): description
             mapping_specifications (dict, optional): mapping from export mapping name to ``MappingSpecification``
             output_format (OutputFormat): output format
+            compression (OutputCompression): output file compression; ignored by formats that are not compressible
+            bulk_insert_batch_size (int): number of rows per insert in SQL bulk-load mode; 0 disables bulk loading
         """
         super().__init__(name, description, ItemInfo.item_type())
         if mapping_specifications is None:
             mapping_specifications = {}
         self._mapping_specifications = mapping_specifications
         self.output_format = output_format
+        self.compression = compression
+        self.bulk_insert_batch_size = bulk_insert_batch_size
 
     def is_equivalent(self, other):
         """
@@ -207,7 +301,10 @@ class Specification(ProjectItemSpecification):
             bool: True if specifications are equivalent, False otherwise
         """
         return (
-            self.output_format == other.output_format and self._mapping_specifications == other._mapping_specifications
+            self.output_format == other.output_format
+            and self.compression == other.compression
+            and self.bulk_insert_batch_size == other.bulk_insert_batch_size
+            and self._mapping_specifications == other._mapping_specifications
         )
 
     def mapping_specifications(self):
@@ -252,6 +349,16 @@ class Specification(ProjectItemSpecification):
         """
         return self._mapping_specifications[name].type
 
+    def effective_compression(self):
+        """Returns the compression that is actually applied to output files.
+
+        Returns:
+            OutputCompression: output compression
+        """
+        if not self.output_format.is_compressible():
+            return OutputCompression.NONE
+        return self.compression
+
     def is_exporting_multiple_files(self):
         """Tests if this specification would result in multiple files being exported.
 
@@ -288,6 +395,8 @@ class Specification(ProjectItemSpecification):
         return {
             "item_type": ItemInfo.item_type(),
             "output_format": self.output_format.value,
+            "compression": self.compression.value,
+            "bulk_insert_batch_size": self.bulk_insert_batch_size,
             "name": self.name,
             "description": self.description,
             "mappings": mappings,
@@ -331,8 +440,17 @@ class Specification(ProjectItemSpecification):
             output_format = OutputFormat(specification_dict["output_format"])
         except ValueError:
             output_format = OutputFormat.default()
+        try:
+            compression = OutputCompression(specification_dict.get("compression", OutputCompression.default().value))
+        except ValueError:
+            compression = OutputCompression.default()
         return Specification(
-            specification_dict["name"], specification_dict["description"], mapping_specifications, output_format
+            specification_dict["name"],
+            specification_dict["description"],
+            mapping_specifications,
+            output_format,
+            compression,
+            specification_dict.get("bulk_insert_batch_size", 0),
         )
 
 
@@ -28,7 +28,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFrame,
     QHBoxLayout, QLabel, QScrollArea, QSizePolicy,
-    QSpacerItem, QToolButton, QVBoxLayout, QWidget)
+    QSpacerItem, QSpinBox, QToolButton, QVBoxLayout, QWidget)
 from spine_items import resources_icons_rc
 
 class Ui_Form(object):
@@ -116,6 +116,22 @@ class Ui_Form(object):
 
         self.verticalLayout_2.addWidget(self.output_time_stamps_check_box)
 
+        self.kept_runs_layout = QHBoxLayout()
+        self.kept_runs_layout.setObjectName(u"kept_runs_layout")
+        self.max_kept_runs_label = QLabel(self.frame)
+        self.max_kept_runs_label.setObjectName(u"max_kept_runs_label")
+
+        self.kept_runs_layout.addWidget(self.max_kept_runs_label)
+
+        self.max_kept_runs_spin_box = QSpinBox(self.frame)
+        self.max_kept_runs_spin_box.setObjectName(u"max_kept_runs_spin_box")
+        self.max_kept_runs_spin_box.setMaximum(9999)
+
+        self.kept_runs_layout.addWidget(self.max_kept_runs_spin_box)
+
+
+        self.verticalLayout_2.addLayout(self.kept_runs_layout)
+
         self.cancel_on_error_check_box = QCheckBox(self.frame)
         self.cancel_on_error_check_box.setObjectName(u"cancel_on_error_check_box")
         self.cancel_on_error_check_box.setChecked(True)
@@ -149,6 +165,11 @@ class Ui_Form(object):
         self.output_time_stamps_check_box.setToolTip(QCoreApplication.translate("Form", u"Checking this will add time stamps to output directory names.", None))
 #endif // QT_CONFIG(tooltip)
         self.output_time_stamps_check_box.setText(QCoreApplication.translate("Form", u"Time stamp output directories", None))
+        self.max_kept_runs_label.setText(QCoreApplication.translate("Form", u"Time stamped runs to keep:", None))
+#if QT_CONFIG(tooltip)
+        self.max_kept_runs_spin_box.setToolTip(QCoreApplication.translate("Form", u"Older time stamped output directories are removed after execution.", None))
+#endif // QT_CONFIG(tooltip)
+        self.max_kept_runs_spin_box.setSpecialValueText(QCoreApplication.translate("Form", u"All", None))
         self.cancel_on_error_check_box.setText(QCoreApplication.translate("Form", u"Cancel export on error", None))
     # retranslateUi
 
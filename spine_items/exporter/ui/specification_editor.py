@@ -69,6 +69,30 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout_3.addWidget(self.export_format_combo_box)
 
+        self.compression_label = QLabel(self.centralwidget)
+        self.compression_label.setObjectName(u"compression_label")
+
+        self.horizontalLayout_3.addWidget(self.compression_label)
+
+        self.compression_combo_box = QComboBox(self.centralwidget)
+        self.compression_combo_box.setObjectName(u"compression_combo_box")
+        sizePolicy1.setHeightForWidth(self.compression_combo_box.sizePolicy().hasHeightForWidth())
+        self.compression_combo_box.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_3.addWidget(self.compression_combo_box)
+
+        self.bulk_insert_label = QLabel(self.centralwidget)
+        self.bulk_insert_label.setObjectName(u"bulk_insert_label")
+
+        self.horizontalLayout_3.addWidget(self.bulk_insert_label)
+
+        self.bulk_insert_batch_size_spin_box = QSpinBox(self.centralwidget)
+        self.bulk_insert_batch_size_spin_box.setObjectName(u"bulk_insert_batch_size_spin_box")
+        self.bulk_insert_batch_size_spin_box.setMaximum(1000000)
+        self.bulk_insert_batch_size_spin_box.setSingleStep(1000)
+
+        self.horizontalLayout_3.addWidget(self.bulk_insert_batch_size_spin_box)
+
         self.live_preview_check_box = QCheckBox(self.centralwidget)
         self.live_preview_check_box.setObjectName(u"live_preview_check_box")
         self.live_preview_check_box.setChecked(True)
@@ -356,7 +380,9 @@ class Ui_MainWindow(object):
         self.verticalLayout_10.addWidget(self.splitter_3)
 
         MainWindow.setCentralWidget(self.centralwidget)
-        QWidget.setTabOrder(self.export_format_combo_box, self.live_preview_check_box)
+        QWidget.setTabOrder(self.export_format_combo_box, self.compression_combo_box)
+        QWidget.setTabOrder(self.compression_combo_box, self.bulk_insert_batch_size_spin_box)
+        QWidget.setTabOrder(self.bulk_insert_batch_size_spin_box, self.live_preview_check_box)
         QWidget.setTabOrder(self.live_preview_check_box, self.database_url_combo_box)
         QWidget.setTabOrder(self.database_url_combo_box, self.load_url_from_fs_button)
         QWidget.setTabOrder(self.load_url_from_fs_button, self.max_preview_tables_spin_box)
@@ -389,6 +415,12 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"Export format:", None))
+        self.compression_label.setText(QCoreApplication.translate("MainWindow", u"Compression:", None))
+        self.bulk_insert_label.setText(QCoreApplication.translate("MainWindow", u"Bulk insert batch size:", None))
+#if QT_CONFIG(tooltip)
+        self.bulk_insert_batch_size_spin_box.setToolTip(QCoreApplication.translate("MainWindow", u"Number of rows per multi-row insert when exporting to SQL. Bulk loading writes everything in a single transaction.", None))
+#endif // QT_CONFIG(tooltip)
+        self.bulk_insert_batch_size_spin_box.setSpecialValueText(QCoreApplication.translate("MainWindow", u"Off", None))
         self.live_preview_check_box.setText(QCoreApplication.translate("MainWindow", u"Live preview", None))
         self.label_9.setText(QCoreApplication.translate("MainWindow", u"Database url:", None))
 #if QT_CONFIG(tooltip)
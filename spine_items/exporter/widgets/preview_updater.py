@@ -12,6 +12,7 @@
 
 """Contains :class:`PreviewUpdater`."""
 
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass
 from multiprocessing import Process, Queue
@@ -26,7 +27,12 @@ from ..mvcmodels.full_url_list_model import FullUrlListModel
 from ..mvcmodels.mappings_table_model import MappingsTableModel
 from ..mvcmodels.preview_table_model import PreviewTableModel
 from ..mvcmodels.preview_tree_model import PreviewTreeModel
-from ..preview_table_writer import TableWriter
+from ..preview_table_writer import StreamingTableWriter
+
+PREVIEW_WORKER_COUNT = 2
+"""Number of preview writer processes."""
+DATABASE_CACHE_SIZE = 4
+"""Number of open database mappings each preview writer keeps."""
 
 
 class PreviewUpdater:
@@ -74,11 +80,14 @@ class PreviewUpdater:
         self._preview_tree_model.dataChanged.connect(self._update_table)
         self._preview_tree_model.dataChanged.connect(self._expand_tree_after_table_change)
         self._preview_tree_model.rowsInserted.connect(self._expand_tree_after_table_insert)
+        self._preview_tree_model.rows_appended.connect(self._append_to_table)
         self._preview_table_model = PreviewTableModel()
         self._stamps = {}
-        self._writer_sender = Queue()
+        self._received_tables = {}
         self._writer_receiver = Queue()
-        self._writer_process = Process(target=write_task_loop, args=(self._writer_receiver, self._writer_sender))
+        self._writer_senders = []
+        self._writer_processes = []
+        self._writer_index_by_url = {}
         self._writer_timer = QTimer(window)
         self._writer_timer.setInterval(100)
         self._writer_timer.timeout.connect(self._communicate)
@@ -105,6 +114,7 @@ class PreviewUpdater:
             return
         self._current_url = current_url
         self._stamps.clear()
+        self._received_tables.clear()
         for row in range(self._mappings_table_model.rowCount()):
             index = self._mappings_table_model.index(row, 0)
             if index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked:
@@ -239,6 +249,22 @@ class PreviewUpdater:
             self._preview_table_model.reset(mapping_name, table_name, table, mapping_colors)
             break
 
+    @Slot(str, str, list)
+    def _append_to_table(self, mapping_name, table_name, rows):
+        """Appends rows to the preview table if it is showing the given table.
+
+        Args:
+            mapping_name (str): mapping's name
+            table_name (str): table's name
+            rows (list of list): appended rows
+        """
+        if (
+            mapping_name != self._preview_table_model.mapping_name()
+            or table_name != self._preview_table_model.table_name()
+        ):
+            return
+        self._preview_table_model.append_rows(rows)
+
     def _set_expect_removals_and_inserts(self, except_removals):
         """Connects and disconnects signals with regarding mapping removals.
 
@@ -413,9 +439,7 @@ class PreviewUpdater:
         id_ = (self._current_url, mapping_name)
         stamp = monotonic()
         self._stamps[id_] = stamp
-        if not self._writer_process.is_alive():
-            self._writer_process.start()
-        self._writer_sender.put(
+        self._writer_sender(self._current_url).put(
             WriteTableTask(
                 self._current_url,
                 mapping_name,
@@ -434,17 +458,41 @@ class PreviewUpdater:
             # new tasks while the pipe is stuck with finished ones.
             self._communicate()
 
+    def _writer_sender(self, url):
+        """Returns the task queue of the writer process that handles given URL.
+
+        Tasks are routed by URL so each database stays open in a single writer's cache.
+        Writer processes are started on demand.
+
+        Args:
+            url (str): database URL
+
+        Returns:
+            Queue: writer's task queue
+        """
+        writer_index = self._writer_index_by_url.get(url)
+        if writer_index is None:
+            writer_index = len(self._writer_index_by_url) % PREVIEW_WORKER_COUNT
+            self._writer_index_by_url[url] = writer_index
+        if writer_index == len(self._writer_processes):
+            sender = Queue()
+            process = Process(target=write_task_loop, args=(self._writer_receiver, sender))
+            process.start()
+            self._writer_senders.append(sender)
+            self._writer_processes.append(process)
+        return self._writer_senders[writer_index]
+
     @Slot()
     def _communicate(self):
-        """Periodically communicates with the writer process."""
+        """Periodically communicates with the writer processes."""
         self._writer_timer.stop()
-        if self._writer_process is None:
+        if self._writer_processes is None:
             return
-        try:
-            message = self._writer_receiver.get_nowait()
-        except queue.Empty:
-            pass
-        else:
+        while True:
+            try:
+                message = self._writer_receiver.get_nowait()
+            except queue.Empty:
+                break
             self._add_or_update_data(*message)
         if self._stamps:
             self._writer_timer.setInterval(50)
@@ -452,23 +500,38 @@ class PreviewUpdater:
         else:
             self._writer_timer.setInterval(100)
 
-    @Slot(tuple, str, object, float)
-    def _add_or_update_data(self, worker_id, mapping_name, data, stamp):
+    @Slot(tuple, str, object, float, bool)
+    def _add_or_update_data(self, worker_id, mapping_name, data, stamp, finished):
         """
-        Sets preview data.
+        Sets or appends preview data.
+
+        The first chunk of a table within a task replaces the table's old contents,
+        subsequent chunks are appended.
+        Once the task has finished, tables that were not written by it are removed.
 
         Args:
             worker_id (tuple): a worker identifier
             mapping_name (str): mapping's name
-            data (dict): mapping from table name to table
+            data (dict): mapping from table name to rows
             stamp (float): task's time stamp
+            finished (bool): True if this is the task's last message
         """
-        current_stamp = self._stamps.pop(worker_id, None)
-        if stamp != current_stamp:
-            if current_stamp is not None:
-                self._stamps[worker_id] = current_stamp
+        if stamp != self._stamps.get(worker_id):
             return
-        self._preview_tree_model.add_or_update_tables(mapping_name, data)
+        received_stamp, received_tables = self._received_tables.get(worker_id, (None, None))
+        if received_stamp != stamp:
+            received_tables = set()
+            self._received_tables[worker_id] = (stamp, received_tables)
+        for table_name, rows in data.items():
+            if table_name in received_tables:
+                self._preview_tree_model.append_rows(mapping_name, table_name, rows)
+            else:
+                self._preview_tree_model.set_table(mapping_name, table_name, rows)
+                received_tables.add(table_name)
+        if finished:
+            del self._stamps[worker_id]
+            self._received_tables.pop(worker_id, None)
+            self._preview_tree_model.remove_tables_except(mapping_name, received_tables)
         mapping_index = self._ui.mappings_table.selectionModel().currentIndex()
         self._change_selected_table(mapping_index, mapping_index)
 
@@ -508,20 +571,23 @@ class PreviewUpdater:
         self._ui.database_url_combo_box = None
 
     def tear_down(self):
-        """Stops the writer process and cleans up."""
-        self._writer_sender.put("quit")
+        """Stops the writer processes and cleans up."""
+        for sender in self._writer_senders:
+            sender.put("quit")
         self._writer_timer.stop()
         self._stamps.clear()
+        self._received_tables.clear()
         self._url_model.rowsInserted.disconnect(self._enable_controls_after_url_insertion)
         self._url_model.modelReset.disconnect(self._enable_controls)
         self._url_model.destroyed.disconnect(self._forget_url_model)
-        if self._writer_process.is_alive():
-            finished = False
-            while not finished:
-                # Drain the pipe, otherwise writer process's send() may block and the join() below hangs.
-                finished = self._writer_receiver.get() == "finished"
-            self._writer_process.join()
-        self._writer_process = None
+        running_count = sum(1 for process in self._writer_processes if process.is_alive())
+        while running_count > 0:
+            # Drain the pipe, otherwise writer process's send() may block and the join() below hangs.
+            if self._writer_receiver.get() == "finished":
+                running_count -= 1
+        for process in self._writer_processes:
+            process.join()
+        self._writer_processes = None
 
 
 @dataclass(frozen=True)
@@ -539,47 +605,163 @@ class WriteTableTask:
 def write_task_loop(sender, receiver):
     """A task loop that processes table writing tasks.
 
+    Only the newest task for each (url, mapping name) pair is kept;
+    superseded tasks are dropped before they are run
+    and a task that is being written is aborted as soon as a newer one arrives.
+
+    Results are sent as (task id, mapping name, tables, stamp, finished) tuples
+    where tables maps table names to rows that should be appended to the table.
+    The last message of a task has finished set to True.
+
     Args:
         sender (Queue): Sending queue to communicate with the loop
         receiver (Queue): Receiving queue endpoint to communicate with the loop
     """
-    db_map = None
-    tasks = []
+    db_maps = DatabaseMappingCache(DATABASE_CACHE_SIZE)
+    tasks = {}
     try:
         while True:
-            if not receiver.empty() or not tasks:
-                while True:
-                    task = receiver.get()
-                    if task == "quit":
-                        return
-                    tasks.append(task)
-                    if receiver.empty():
-                        break
-            next_task = tasks.pop(0)
+            if not _receive_tasks(receiver, tasks, block=not tasks):
+                return
+            task_id = next(iter(tasks))
+            next_task = tasks.pop(task_id)
+            quit_requested = False
+
+            def keep_writing():
+                nonlocal quit_requested
+                if not _receive_tasks(receiver, tasks, block=False):
+                    quit_requested = True
+                return not quit_requested and task_id not in tasks
+
+            def send_chunk(tables):
+                sender.put((task_id, next_task.mapping_name, tables, next_task.stamp, False))
+
             try:
-                if db_map is None or next_task.url != db_map.db_url:
-                    db_map = DatabaseMapping(next_task.url)
-                tables = _write_tables(db_map, next_task)
+                db_map = db_maps.get(next_task.url)
+                completed = _write_tables(db_map, next_task, send_chunk, keep_writing)
+                final_tables = {}
             except SpineDBVersionError:
-                tables = {"error": [["unsupported database version"]]}
+                completed = True
+                final_tables = {"error": [["unsupported database version"]]}
             except SpineDBAPIError as error:
-                tables = {"error": [[str(error)]]}
-            sender.put(((next_task.url, next_task.mapping_name), next_task.mapping_name, tables, next_task.stamp))
+                completed = True
+                final_tables = {"error": [[str(error)]]}
+            if quit_requested:
+                return
+            if not completed or task_id in tasks:
+                continue
+            sender.put((task_id, next_task.mapping_name, final_tables, next_task.stamp, True))
     finally:
+        db_maps.close()
         sender.put_nowait("finished")
 
 
-def _write_tables(db_map, write_task):
-    """Creates preview tables with given parameters.
+class DatabaseMappingCache:
+    """A least-recently-used cache of open database mappings keyed by URL.
+
+    A cached mapping is reopened when the database's commit count has changed since it was opened.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): maximum number of open database mappings
+        """
+        self._capacity = capacity
+        self._db_maps = OrderedDict()
+
+    def get(self, url):
+        """Returns an up-to-date database mapping for given URL.
+
+        Args:
+            url (str): database URL
+
+        Returns:
+            DatabaseMapping: database mapping
+        """
+        cached = self._db_maps.get(url)
+        if cached is not None:
+            db_map, commit_count = cached
+            if _commit_count(db_map) == commit_count:
+                self._db_maps.move_to_end(url)
+                return db_map
+            del self._db_maps[url]
+            db_map.close()
+        db_map = DatabaseMapping(url)
+        self._db_maps[url] = (db_map, _commit_count(db_map))
+        while len(self._db_maps) > self._capacity:
+            _, (evicted, _) = self._db_maps.popitem(last=False)
+            evicted.close()
+        return db_map
+
+    def close(self):
+        """Closes all cached database mappings."""
+        for db_map, _ in self._db_maps.values():
+            db_map.close()
+        self._db_maps.clear()
+
+
+def _commit_count(db_map):
+    """Queries the number of commits in database.
+
+    Args:
+        db_map (DatabaseMapping): database mapping
+
+    Returns:
+        int: commit count
+    """
+    with db_map:
+        return db_map.query(db_map.commit_sq).count()
+
+
+def _receive_tasks(receiver, tasks, block):
+    """Moves pending tasks from receiver to task dictionary replacing superseded tasks.
+
+    Args:
+        receiver (Queue): task queue
+        tasks (dict): mapping from (url, mapping name) to task
+        block (bool): if True, waits for at least one task
+
+    Returns:
+        bool: False if quit was requested, True otherwise
+    """
+    while True:
+        try:
+            task = receiver.get() if block else receiver.get_nowait()
+        except queue.Empty:
+            return True
+        if task == "quit":
+            return False
+        _add_task(tasks, task)
+        block = False
+
+
+def _add_task(tasks, task):
+    """Adds task to task dictionary unless a newer task for the same table already exists.
+
+    Args:
+        tasks (dict): mapping from (url, mapping name) to task
+        task (WriteTableTask): task to add
+    """
+    task_id = (task.url, task.mapping_name)
+    existing = tasks.get(task_id)
+    if existing is None or existing.stamp < task.stamp:
+        tasks[task_id] = task
+
+
+def _write_tables(db_map, write_task, send_chunk, keep_writing=None):
+    """Writes preview tables with given parameters streaming the rows in chunks.
 
     Args:
         db_map (DatabaseMapping): database mapping
         write_task (WriteTableTask): task parameters
+        send_chunk (Callable): function that receives a dictionary from table name to new rows
+        keep_writing (Callable, optional): function that returns False when writing should be aborted
 
     Returns:
-        tuple: mappings from table names to tables (list of rows)
+        bool: True if writing was completed, False if it was aborted
     """
-    writer = TableWriter()
+    writer = StreamingTableWriter(send_chunk, keep_writing)
     write(
         db_map,
         writer,
@@ -589,4 +771,4 @@ def _write_tables(db_map, write_task):
         max_rows=write_task.max_rows,
         group_fns=write_task.group_fn,
     )
-    return writer.tables
+    return not writer.cancelled
@@ -59,6 +59,8 @@ from ..commands import (
     RemoveMapping,
     RenameMapping,
     SetAlwaysExportHeader,
+    SetBulkInsertBatchSize,
+    SetExportCompression,
     SetExportFormat,
     SetFixedTableName,
     SetGroupFunction,
@@ -71,7 +73,14 @@ from ..commands import (
 from ..mvcmodels.mapping_editor_table_model import POSITION_DISPLAY_TEXT, EditorColumn, MappingEditorTableModel
 from ..mvcmodels.mappings_table_model import MappingsTableModel
 from ..mvcmodels.mappings_table_proxy import MappingsTableProxy
-from ..specification import MappingSpecification, MappingType, OutputFormat, Specification
+from ..specification import (
+    MappingSpecification,
+    MappingType,
+    OutputCompression,
+    OutputFormat,
+    Specification,
+    split_compression_extension,
+)
 from .filter_edit_delegate import FilterEditDelegate
 from .position_edit_delegate import PositionEditDelegate
 from .preview_updater import PreviewUpdater
@@ -129,11 +138,10 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         super().__init__(toolbox, specification, item)
         if specification is None:
             output_format = self._sniff_export_format() if item is not None else OutputFormat.default()
+            compression = self._sniff_compression() if item is not None else OutputCompression.default()
+            self._new_spec = Specification(output_format=output_format, compression=compression)
         else:
-            output_format = specification.output_format
-        self._new_spec = (
-            deepcopy(specification) if specification is not None else Specification(output_format=output_format)
-        )
+            self._new_spec = deepcopy(specification)
         self._mappings_table_model = MappingsTableModel(self._new_spec.mapping_specifications(), self)
         self._mappings_table_model.dataChanged.connect(self._update_ui_after_mapping_change)
         self._mappings_table_model.rename_requested.connect(self._rename_mapping)
@@ -153,6 +161,13 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         self._ui.export_format_combo_box.addItems([output_format.value for output_format in OutputFormat])
         self._ui.export_format_combo_box.setCurrentText(self._new_spec.output_format.value)
         self._ui.export_format_combo_box.currentTextChanged.connect(self._change_format)
+        self._ui.compression_combo_box.addItems([compression.value for compression in OutputCompression])
+        self._ui.compression_combo_box.setCurrentText(self._new_spec.compression.value)
+        self._ui.compression_combo_box.setEnabled(self._new_spec.output_format.is_compressible())
+        self._ui.compression_combo_box.currentTextChanged.connect(self._change_compression)
+        self._ui.bulk_insert_batch_size_spin_box.setValue(self._new_spec.bulk_insert_batch_size)
+        self._ui.bulk_insert_batch_size_spin_box.setEnabled(self._new_spec.output_format == OutputFormat.SQL)
+        self._ui.bulk_insert_batch_size_spin_box.valueChanged.connect(self._change_bulk_insert_batch_size)
         self._add_mapping_action = QAction("Add Mapping", self)
         self._add_mapping_action.triggered.connect(self._new_mapping)
         self._ui.add_mapping_button.clicked.connect(self._add_mapping_action.trigger)
@@ -242,7 +257,9 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
         description = self._spec_toolbar.description()
         mapping_specification = deepcopy(self._new_spec.mapping_specifications())
         output_format = self._new_spec.output_format
-        return Specification(spec_name, description, mapping_specification, output_format)
+        compression = self._new_spec.compression
+        batch_size = self._new_spec.bulk_insert_batch_size
+        return Specification(spec_name, description, mapping_specification, output_format, compression, batch_size)
 
     @Slot(str)
     def _change_format(self, current):
@@ -267,6 +284,58 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
             self._ui.export_format_combo_box.currentTextChanged.disconnect(self._change_format)
             self._ui.export_format_combo_box.setCurrentText(export_format.value)
             self._ui.export_format_combo_box.currentTextChanged.connect(self._change_format)
+        self._ui.compression_combo_box.setEnabled(export_format.is_compressible())
+        self._ui.bulk_insert_batch_size_spin_box.setEnabled(export_format == OutputFormat.SQL)
+
+    @Slot(str)
+    def _change_compression(self, current):
+        """
+        Pushes ``SetExportCompression`` command to undo stack.
+
+        Args:
+            current (str): new compression
+        """
+        compression = OutputCompression(current)
+        self._undo_stack.push(SetExportCompression(self, compression, self._new_spec.compression))
+
+    def set_export_compression_silently(self, compression):
+        """
+        Sets export compression.
+
+        Args:
+            compression (OutputCompression): new compression
+        """
+        self._new_spec.compression = compression
+        if compression.value != self._ui.compression_combo_box.currentText():
+            self._ui.compression_combo_box.currentTextChanged.disconnect(self._change_compression)
+            self._ui.compression_combo_box.setCurrentText(compression.value)
+            self._ui.compression_combo_box.currentTextChanged.connect(self._change_compression)
+        self._ui.bulk_insert_batch_size_spin_box.setValue(self._new_spec.bulk_insert_batch_size)
+        self._ui.bulk_insert_batch_size_spin_box.setEnabled(self._new_spec.output_format == OutputFormat.SQL)
+        self._ui.bulk_insert_batch_size_spin_box.valueChanged.connect(self._change_bulk_insert_batch_size)
+
+    @Slot(int)
+    def _change_bulk_insert_batch_size(self, batch_size):
+        """
+        Pushes ``SetBulkInsertBatchSize`` command to undo stack.
+
+        Args:
+            batch_size (int): new batch size
+        """
+        self._undo_stack.push(SetBulkInsertBatchSize(self, batch_size, self._new_spec.bulk_insert_batch_size))
+
+    def set_bulk_insert_batch_size_silently(self, batch_size):
+        """
+        Sets bulk insert batch size.
+
+        Args:
+            batch_size (int): new batch size
+        """
+        self._new_spec.bulk_insert_batch_size = batch_size
+        if batch_size != self._ui.bulk_insert_batch_size_spin_box.value():
+            self._ui.bulk_insert_batch_size_spin_box.valueChanged.disconnect(self._change_bulk_insert_batch_size)
+            self._ui.bulk_insert_batch_size_spin_box.setValue(batch_size)
+            self._ui.bulk_insert_batch_size_spin_box.valueChanged.connect(self._change_bulk_insert_batch_size)
 
     def _sniff_export_format(self):
         """Tries to guess the export file format from user given export label.
@@ -278,6 +347,7 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
             return OutputFormat.SQL
         out_labels = self.item.get_out_labels()
         for label in out_labels:
+            label, _ = split_compression_extension(label)
             _, separator, extension = label.rpartition(".")
             if not separator:
                 continue
@@ -287,6 +357,18 @@ class SpecificationEditorWindow(SpecificationEditorWindowBase):
             return output_format if output_format is not None else OutputFormat.default()
         return OutputFormat.default()
 
+    def _sniff_compression(self):
+        """Tries to guess the export compression from user given export label.
+
+        Returns:
+            OutputCompression: export compression
+        """
+        for label in self.item.get_out_labels():
+            _, compression = split_compression_extension(label)
+            if compression != OutputCompression.NONE:
+                return compression
+        return OutputCompression.default()
+
     def show_on_table(self, mapping_name):
         """
         Changes the current mapping.
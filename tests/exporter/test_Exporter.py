@@ -71,6 +71,19 @@ class TestExporter:
         assert deserialized.name == "new exporter"
         assert deserialized.description == "item description"
 
+    def test_max_kept_runs_is_serialized(self, exporter, spine_toolbox_with_project):
+        toolbox = spine_toolbox_with_project
+        exporter.activate()
+        assert not exporter._properties_ui.max_kept_runs_spin_box.isEnabled()
+        exporter.set_output_time_stamps_flag(True)
+        assert exporter._properties_ui.max_kept_runs_spin_box.isEnabled()
+        exporter.set_max_kept_runs(3)
+        assert exporter._properties_ui.max_kept_runs_spin_box.value() == 3
+        item_dict = exporter.item_dict()
+        assert item_dict["max_kept_runs"] == 3
+        deserialized = Exporter.from_dict("new exporter", item_dict, toolbox, toolbox.project())
+        assert deserialized._max_kept_runs == 3
+
     def test_notify_destination(self, exporter, spine_toolbox_with_project):
         toolbox = spine_toolbox_with_project
         toolbox.msg = MagicMock()
@@ -0,0 +1,122 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+"""Unit tests for the ``arrow_writers`` module."""
+
+import os.path
+from tempfile import TemporaryDirectory
+import unittest
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+from spine_items.exporter.arrow_writers import ArrowIpcWriter, ParquetWriter
+from spinedb_api import parameter_value
+from spinedb_api.spine_io.exporters.writer import WriterException
+
+
+class TestParquetWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_columns_are_typed(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        writer.start()
+        self.assertTrue(writer.start_table(None, {}))
+        self.assertTrue(writer.write_row(["name", "count", "value", "flag", "time"]))
+        self.assertTrue(writer.write_row(["a", 1, 2.5, True, parameter_value.DateTime("2020-01-01T12:00")]))
+        self.assertTrue(writer.write_row(["b", None, 3, False, None]))
+        writer.finish_table()
+        writer.finish()
+        out_path = os.path.join(self._temp_dir.name, "out.parquet")
+        self.assertEqual(writer.output_files(), {out_path})
+        table = pyarrow.parquet.read_table(out_path)
+        self.assertEqual(table.schema.field("name").type, pyarrow.string())
+        self.assertEqual(table.schema.field("count").type, pyarrow.int64())
+        self.assertEqual(table.schema.field("value").type, pyarrow.float64())
+        self.assertEqual(table.schema.field("flag").type, pyarrow.bool_())
+        self.assertTrue(pyarrow.types.is_timestamp(table.schema.field("time").type))
+        self.assertEqual(table.column("name").to_pylist(), ["a", "b"])
+        self.assertEqual(table.column("count").to_pylist(), [1, None])
+        self.assertEqual(table.column("value").to_pylist(), [2.5, 3.0])
+
+    def test_batches_become_row_groups(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", batch_size=2)
+        writer.start()
+        writer.start_table(None, {})
+        writer.write_row(["x"])
+        for i in range(5):
+            writer.write_row([float(i)])
+        writer.finish_table()
+        writer.finish()
+        parquet_file = pyarrow.parquet.ParquetFile(os.path.join(self._temp_dir.name, "out.parquet"))
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        self.assertEqual(parquet_file.read().column("x").to_pylist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_named_tables_go_to_separate_files(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        writer.start()
+        for table_name in ("t1", "t2", "t1"):
+            writer.start_table(table_name, {})
+            writer.write_row(["x"])
+            writer.write_row([table_name])
+            writer.finish_table()
+        writer.finish()
+        t1_path = os.path.join(self._temp_dir.name, "t1.parquet")
+        t2_path = os.path.join(self._temp_dir.name, "t2.parquet")
+        self.assertEqual(writer.output_files(), {t1_path, t2_path})
+        self.assertEqual(pyarrow.parquet.read_table(t1_path).column("x").to_pylist(), ["t1", "t1"])
+        self.assertEqual(pyarrow.parquet.read_table(t2_path).column("x").to_pylist(), ["t2"])
+
+    def test_header_only_table_creates_empty_file(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet")
+        writer.start()
+        writer.start_table(None, {})
+        writer.write_row(["x", "y"])
+        writer.finish_table()
+        writer.finish()
+        table = pyarrow.parquet.read_table(os.path.join(self._temp_dir.name, "out.parquet"))
+        self.assertEqual(table.column_names, ["x", "y"])
+        self.assertEqual(table.num_rows, 0)
+
+    def test_incompatible_value_in_later_batch_raises(self):
+        writer = ParquetWriter(self._temp_dir.name, "out.parquet", batch_size=1)
+        writer.start()
+        writer.start_table(None, {})
+        writer.write_row(["x"])
+        writer.write_row([1.0])
+        with self.assertRaises(WriterException):
+            writer.write_row(["not a number"])
+        writer.finish()
+
+
+class TestArrowIpcWriter(unittest.TestCase):
+    def test_write_table(self):
+        with TemporaryDirectory() as temp_dir:
+            writer = ArrowIpcWriter(temp_dir, "out.arrow")
+            writer.start()
+            writer.start_table(None, {})
+            writer.write_row(["name", "value"])
+            writer.write_row(["a", 2.3])
+            writer.write_row(["b", 5.0])
+            writer.finish_table()
+            writer.finish()
+            with pyarrow.memory_map(os.path.join(temp_dir, "out.arrow")) as source:
+                table = pyarrow.ipc.open_file(source).read_all()
+            self.assertEqual(table.column("name").to_pylist(), ["a", "b"])
+            self.assertEqual(table.schema.field("value").type, pyarrow.float64())
+            self.assertEqual(table.column("value").to_pylist(), [2.3, 5.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
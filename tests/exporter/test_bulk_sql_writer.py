@@ -0,0 +1,97 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+"""Unit tests for the ``bulk_sql_writer`` module."""
+
+import os.path
+import sqlite3
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.exporter.bulk_sql_writer import BulkSqlWriter
+from spinedb_api.spine_io.exporters.writer import WriterException
+
+
+class TestBulkSqlWriter(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._database_path = os.path.join(self._temp_dir.name, "out.sqlite")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _query(self, statement):
+        connection = sqlite3.connect(self._database_path)
+        try:
+            return connection.execute(statement).fetchall()
+        finally:
+            connection.close()
+
+    def test_rows_are_written_in_batches(self):
+        writer = BulkSqlWriter(self._database_path, overwrite_existing=True, batch_size=2)
+        writer.start()
+        self.assertTrue(writer.start_table("data", {}))
+        self.assertTrue(writer.write_row(["name", "value"]))
+        for i in range(5):
+            self.assertTrue(writer.write_row([f"n{i}", float(i)]))
+        writer.finish_table()
+        writer.finish()
+        self.assertEqual(writer.row_count, 5)
+        self.assertEqual(
+            self._query("SELECT * FROM data"), [("n0", 0.0), ("n1", 1.0), ("n2", 2.0), ("n3", 3.0), ("n4", 4.0)]
+        )
+
+    def test_header_only_table_is_created(self):
+        writer = BulkSqlWriter(self._database_path, overwrite_existing=True, batch_size=10)
+        writer.start()
+        writer.start_table("empty", {})
+        writer.write_row(["x", "y"])
+        writer.finish_table()
+        writer.finish()
+        self.assertEqual(self._query("SELECT * FROM empty"), [])
+
+    def test_indexes_of_existing_tables_are_rebuilt(self):
+        connection = sqlite3.connect(self._database_path)
+        connection.execute("CREATE TABLE data (name TEXT, value FLOAT)")
+        connection.execute("CREATE INDEX data_name ON data (name)")
+        connection.execute("INSERT INTO data VALUES ('old', -1.0)")
+        connection.commit()
+        connection.close()
+        writer = BulkSqlWriter(self._database_path, overwrite_existing=False, batch_size=10)
+        writer.start()
+        writer.start_table("data", {})
+        writer.write_row(["name", "value"])
+        writer.write_row(["new", 1.0])
+        writer.finish_table()
+        writer.finish()
+        self.assertEqual(self._query("SELECT * FROM data"), [("old", -1.0), ("new", 1.0)])
+        self.assertEqual(self._query("SELECT name FROM sqlite_master WHERE type = 'index'"), [("data_name",)])
+
+    def test_inserted_rows_are_rolled_back_on_error(self):
+        writer = BulkSqlWriter(self._database_path, overwrite_existing=True, batch_size=1)
+        writer.start()
+        with self.assertRaises(WriterException):
+            try:
+                writer.start_table("data", {})
+                writer.write_row(["name"])
+                writer.write_row(["a"])
+                writer.finish_table()
+                raise WriterException("interrupted")
+            finally:
+                writer.finish()
+        self.assertEqual(self._query("SELECT * FROM data"), [])
+
+    def test_non_positive_batch_size_raises(self):
+        with self.assertRaises(WriterException):
+            BulkSqlWriter(self._database_path, overwrite_existing=True, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
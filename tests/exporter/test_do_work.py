@@ -13,13 +13,22 @@
 """Unit tests for Exporter's :func:`do_work` function."""
 
 from csv import reader
+import gzip
 import os.path
 import sqlite3
 from tempfile import TemporaryDirectory
 import unittest
-from unittest.mock import MagicMock
-from spine_items.exporter.do_work import do_work
-from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from unittest.mock import MagicMock, patch
+import pyarrow.parquet
+import pytest
+from spine_items.exporter.do_work import _add_extension, do_work
+from spine_items.exporter.specification import (
+    MappingSpecification,
+    MappingType,
+    OutputCompression,
+    OutputFormat,
+    Specification,
+)
 from spinedb_api import DatabaseMapping, import_object_classes, import_objects
 from spinedb_api.export_mapping import entity_export
 from spinedb_api.export_mapping.export_mapping import FixedValueMapping
@@ -61,6 +70,91 @@ class TestWithCsvWriter(unittest.TestCase):
         expected = [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]]
         self.assertEqual(table, expected)
 
+    def test_export_database_with_gzip_compression(self):
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification(
+            "name", "description", {"mapping": mapping_specification}, compression=OutputCompression.GZIP
+        )
+        databases = {self._url: "test_export_gzip"}
+        logger = MagicMock()
+        success, written_files = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        out_path = os.path.join(self._temp_dir.name, "test_export_gzip.csv.gz")
+        self.assertEqual(written_files, {"test_export_gzip": {out_path}})
+        with gzip.open(out_path, "rt", newline="", encoding="utf-8") as input_:
+            table = list(reader(input_))
+        expected = [["oc1", "o11"], ["oc1", "o12"], ["oc2", "o21"], ["oc2", "o22"], ["oc2", "o23"]]
+        self.assertEqual(table, expected)
+
+    def test_export_multiple_tables_with_zstd_compression(self):
+        zstandard = pytest.importorskip("zstandard")
+        root_mapping = entity_export(entity_class_position=Position.table_name, entity_position=0)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification(
+            "name", "description", {"mapping": mapping_specification}, compression=OutputCompression.ZSTD
+        )
+        out_dir = os.path.join(self._temp_dir.name, "zstd")
+        databases = {self._url: "test_export_zstd.csv"}
+        logger = MagicMock()
+        success, written_files = do_work(
+            None, specification.to_dict(), False, False, "", out_dir, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        expected_files = {os.path.join(out_dir, "oc1.csv.zst"), os.path.join(out_dir, "oc2.csv.zst")}
+        self.assertEqual(written_files, {"test_export_zstd.csv": expected_files})
+        with zstandard.open(os.path.join(out_dir, "oc2.csv.zst"), "rt", newline="", encoding="utf-8") as input_:
+            table = list(reader(input_))
+        self.assertEqual(table, [["o21"], ["o22"], ["o23"]])
+
+    def test_export_database_to_parquet(self):
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        root_mapping.header = "class"
+        root_mapping.child.child.header = "entity"
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification}, OutputFormat.PARQUET)
+        databases = {self._url: "test_export_parquet"}
+        logger = MagicMock()
+        success, written_files = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, {}, "", "", logger
+        )
+        self.assertTrue(success)
+        out_path = os.path.join(self._temp_dir.name, "test_export_parquet.parquet")
+        self.assertEqual(written_files, {"test_export_parquet": {out_path}})
+        table = pyarrow.parquet.read_table(out_path)
+        self.assertEqual(table.column("class").to_pylist(), ["oc1", "oc1", "oc2", "oc2", "oc2"])
+        self.assertEqual(table.column("entity").to_pylist(), ["o11", "o12", "o21", "o22", "o23"])
+
+    def test_identical_time_stamped_outputs_share_data_and_old_runs_are_pruned(self):
+        root_mapping = entity_export(entity_class_position=0, entity_position=1)
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification("name", "description", {"mapping": mapping_specification})
+        out_dir = os.path.join(self._temp_dir.name, "time_stamped")
+        databases = {self._url: "out.csv"}
+        logger = MagicMock()
+        outputs = []
+        for stamp in (1700000000.0, 1700000001.0, 1700000002.0):
+            with patch("spine_items.exporter.do_work.time", return_value=stamp):
+                success, written_files = do_work(
+                    None, specification.to_dict(), True, False, "", out_dir, databases, {}, "", "", logger, 2
+                )
+            self.assertTrue(success)
+            outputs.append(next(iter(written_files["out.csv"])))
+        self.assertFalse(os.path.exists(outputs[0]))
+        self.assertTrue(os.path.samefile(outputs[1], outputs[2]))
+        self.assertEqual(len(os.listdir(out_dir)), 2)
+        self.assertFalse(any(name.startswith(".staging") for name in os.listdir(os.path.dirname(outputs[2]))))
+
     def test_export_to_output_database(self):
         object_root = entity_export(entity_class_position=0, entity_position=1)
         object_root.header = "object_class"
@@ -96,3 +190,32 @@ class TestWithCsvWriter(unittest.TestCase):
         expected = [("oc1", "o11"), ("oc1", "o12"), ("oc2", "o21"), ("oc2", "o22"), ("oc2", "o23")]
         self.assertEqual(cursor.execute("SELECT * FROM data_table").fetchall(), expected)
         connection.close()
+
+    def test_bulk_export_to_output_database(self):
+        object_root = entity_export(entity_class_position=0, entity_position=1)
+        object_root.header = "object_class"
+        object_root.child.child.header = "object"
+        root_mapping = FixedValueMapping(Position.table_name, "data_table")
+        root_mapping.child = object_root
+        mapping_specification = MappingSpecification(
+            MappingType.entities, True, True, NoGroup.NAME, False, root_mapping
+        )
+        specification = Specification(
+            "name", "description", {"mapping": mapping_specification}, OutputFormat.SQL, bulk_insert_batch_size=2
+        )
+        databases = {self._url: "output label"}
+        out_path = os.path.join(self._temp_dir.name, "bulk_out_database.sqlite")
+        out_urls = {self._url: {"dialect": "sqlite", "database": out_path}}
+        logger = MagicMock()
+        success, _ = do_work(
+            None, specification.to_dict(), False, False, "", self._temp_dir.name, databases, out_urls, "", "", logger
+        )
+        self.assertTrue(success)
+        message = logger.msg_success.emit.call_args.args[0]
+        self.assertTrue(message.startswith("Wrote 5 rows to database in "))
+        self.assertTrue(message.endswith(" rows/s)."))
+        connection = sqlite3.connect(out_path)
+        cursor = connection.cursor()
+        expected = [("oc1", "o11"), ("oc1", "o12"), ("oc2", "o21"), ("oc2", "o22"), ("oc2", "o23")]
+        self.assertEqual(cursor.execute("SELECT * FROM data_table").fetchall(), expected)
+        connection.close()
@@ -0,0 +1,94 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Items contributors
+# This file is part of Spine Items.
+# Spine Items is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+"""Unit tests for the ``output_files`` module."""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from spine_items.exporter.output_files import (
+    link_to_identical_earlier_output,
+    move_into_place,
+    prune_run_directories,
+    run_directories,
+)
+
+
+class TestOutputFiles(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._out_dir = Path(self._temp_dir.name)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write(self, relative_path, content):
+        path = self._out_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        return path
+
+    def test_move_into_place_replaces_existing_files(self):
+        staged = self._write(Path(".staging", "out.csv"), "new")
+        self._write("out.csv", "old")
+        moved = move_into_place([str(staged)], self._out_dir)
+        self.assertEqual(moved, {str(self._out_dir / "out.csv")})
+        self.assertEqual((self._out_dir / "out.csv").read_text(), "new")
+        self.assertFalse(staged.exists())
+
+    def test_run_directories_are_sorted_and_filtered_by_prefix(self):
+        for name in ("run@2024-01-02T00.00.00", "run@2024-01-01T00.00.00", "abc_run@2024-01-01T00.00.00", "other"):
+            (self._out_dir / name).mkdir()
+        self.assertEqual(
+            run_directories(self._out_dir, ""),
+            [self._out_dir / "run@2024-01-01T00.00.00", self._out_dir / "run@2024-01-02T00.00.00"],
+        )
+        self.assertEqual(run_directories(self._out_dir, "abc_"), [self._out_dir / "abc_run@2024-01-01T00.00.00"])
+
+    def test_identical_file_is_linked_to_earlier_output(self):
+        earlier = self._write(Path("run@1", "out.csv"), "a,b\n")
+        current = self._write(Path("run@2", "out.csv"), "a,b\n")
+        self.assertTrue(link_to_identical_earlier_output(current, [self._out_dir / "run@1"]))
+        self.assertTrue(os.path.samefile(earlier, current))
+        self.assertEqual(current.read_text(), "a,b\n")
+
+    def test_different_file_is_not_linked(self):
+        earlier = self._write(Path("run@1", "out.csv"), "a,b\n")
+        current = self._write(Path("run@2", "out.csv"), "a,c\n")
+        self.assertFalse(link_to_identical_earlier_output(current, [self._out_dir / "run@1"]))
+        self.assertFalse(os.path.samefile(earlier, current))
+        self.assertEqual(current.read_text(), "a,c\n")
+
+    def test_only_latest_earlier_output_is_compared(self):
+        self._write(Path("run@1", "out.csv"), "same")
+        latest = self._write(Path("run@2", "out.csv"), "different")
+        current = self._write(Path("run@3", "out.csv"), "same")
+        run_dirs = [self._out_dir / "run@1", self._out_dir / "run@2"]
+        self.assertFalse(link_to_identical_earlier_output(current, run_dirs))
+        self.assertFalse(os.path.samefile(latest, current))
+
+    def test_prune_run_directories(self):
+        for name in ("run@1", "run@2", "run@3", "abc_run@1"):
+            self._write(Path(name, "out.csv"), name)
+        removed = prune_run_directories(self._out_dir, "", 2)
+        self.assertEqual(removed, [self._out_dir / "run@1"])
+        self.assertEqual(sorted(path.name for path in self._out_dir.iterdir()), ["abc_run@1", "run@2", "run@3"])
+
+    def test_zero_kept_runs_keeps_everything(self):
+        for name in ("run@1", "run@2"):
+            self._write(Path(name, "out.csv"), name)
+        self.assertEqual(prune_run_directories(self._out_dir, "", 0), [])
+        self.assertEqual(len(list(self._out_dir.iterdir())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
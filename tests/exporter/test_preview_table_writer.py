@@ -11,7 +11,7 @@
 ######################################################################################################################
 import unittest
 import numpy
-from spine_items.exporter.preview_table_writer import TableWriter
+from spine_items.exporter.preview_table_writer import CANCELLATION_CHECK_INTERVAL, TableWriter
 
 
 class TestTableWriter(unittest.TestCase):
@@ -30,5 +30,39 @@ class TestTableWriter(unittest.TestCase):
         self.assertEqual(tables, {"My table": [[2.3]]})
 
 
+class TestCancellableTableWriter(unittest.TestCase):
+    def test_start_table_fails_when_cancelled(self):
+        writer = TableWriter(lambda: False)
+        writer.start()
+        self.assertFalse(writer.start_table("My table", {}))
+        writer.finish()
+        self.assertTrue(writer.cancelled)
+        self.assertEqual(writer.tables, {})
+
+    def test_write_row_stops_after_check_interval_when_cancelled(self):
+        keep_writing = [True]
+        writer = TableWriter(lambda: keep_writing[0])
+        writer.start()
+        self.assertTrue(writer.start_table("My table", {}))
+        keep_writing[0] = False
+        for i in range(CANCELLATION_CHECK_INTERVAL - 1):
+            self.assertTrue(writer.write_row([i]))
+        self.assertFalse(writer.write_row([CANCELLATION_CHECK_INTERVAL - 1]))
+        writer.finish_table()
+        writer.finish()
+        self.assertTrue(writer.cancelled)
+
+    def test_writing_continues_when_callback_allows(self):
+        writer = TableWriter(lambda: True)
+        writer.start()
+        self.assertTrue(writer.start_table("My table", {}))
+        for i in range(2 * CANCELLATION_CHECK_INTERVAL):
+            self.assertTrue(writer.write_row([i]))
+        writer.finish_table()
+        writer.finish()
+        self.assertFalse(writer.cancelled)
+        self.assertEqual(len(writer.tables["My table"]), 2 * CANCELLATION_CHECK_INTERVAL)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,14 @@
 """Unit tests for the ''specification'' module"""
 
 import unittest
-from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from spine_items.exporter.specification import (
+    MappingSpecification,
+    MappingType,
+    OutputCompression,
+    OutputFormat,
+    Specification,
+    split_compression_extension,
+)
 from spinedb_api.export_mapping import entity_export
 from spinedb_api.mapping import Position
 
@@ -33,6 +40,52 @@ class TestSpecification(unittest.TestCase):
         specification = Specification(mapping_specifications=mapping_specifications, output_format=OutputFormat.CSV)
         self.assertTrue(specification.is_exporting_multiple_files())
 
+    def test_compression_survives_serialization(self):
+        specification = Specification("spec", output_format=OutputFormat.CSV, compression=OutputCompression.ZSTD)
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.compression, OutputCompression.ZSTD)
+        self.assertTrue(restored.is_equivalent(specification))
+
+    def test_bulk_insert_batch_size_survives_serialization(self):
+        specification = Specification("spec", output_format=OutputFormat.SQL, bulk_insert_batch_size=5000)
+        restored = Specification.from_dict(specification.to_dict())
+        self.assertEqual(restored.bulk_insert_batch_size, 5000)
+        self.assertTrue(restored.is_equivalent(specification))
+
+    def test_compression_defaults_to_none_for_legacy_dicts(self):
+        specification_dict = Specification("spec").to_dict()
+        del specification_dict["compression"]
+        del specification_dict["bulk_insert_batch_size"]
+        restored = Specification.from_dict(specification_dict)
+        self.assertEqual(restored.compression, OutputCompression.NONE)
+        self.assertEqual(restored.bulk_insert_batch_size, 0)
+
+    def test_effective_compression_is_none_for_incompressible_formats(self):
+        specification = Specification("spec", output_format=OutputFormat.EXCEL, compression=OutputCompression.GZIP)
+        self.assertEqual(specification.effective_compression(), OutputCompression.NONE)
+        specification.output_format = OutputFormat.CSV
+        self.assertEqual(specification.effective_compression(), OutputCompression.GZIP)
+
+
+class TestOutputCompression(unittest.TestCase):
+    def test_every_compression_has_file_extension(self):
+        for compression in OutputCompression:
+            try:
+                compression.file_extension()
+            except KeyError:
+                self.fail(f"{compression} is missing file extension")
+
+    def test_compression_from_extension(self):
+        self.assertEqual(OutputCompression.compression_from_extension("gz"), OutputCompression.GZIP)
+        self.assertEqual(OutputCompression.compression_from_extension("zst"), OutputCompression.ZSTD)
+        self.assertIsNone(OutputCompression.compression_from_extension("csv"))
+
+    def test_split_compression_extension(self):
+        self.assertEqual(split_compression_extension("out.csv.gz"), ("out.csv", OutputCompression.GZIP))
+        self.assertEqual(split_compression_extension("out.csv.zst"), ("out.csv", OutputCompression.ZSTD))
+        self.assertEqual(split_compression_extension("out.csv"), ("out.csv", OutputCompression.NONE))
+        self.assertEqual(split_compression_extension(".gz"), (".gz", OutputCompression.NONE))
+
 
 class TestOutputFormat(unittest.TestCase):
     def test_compatible_file_extensions(self):
@@ -46,6 +99,11 @@ class TestOutputFormat(unittest.TestCase):
         self.assertFalse(OutputFormat.GDX.is_compatible_file_extension("XXX"))
         self.assertTrue(OutputFormat.SQL.is_compatible_file_extension("sqlite"))
         self.assertFalse(OutputFormat.SQL.is_compatible_file_extension("XXX"))
+        self.assertTrue(OutputFormat.PARQUET.is_compatible_file_extension("parquet"))
+        self.assertFalse(OutputFormat.PARQUET.is_compatible_file_extension("XXX"))
+        self.assertTrue(OutputFormat.ARROW.is_compatible_file_extension("arrow"))
+        self.assertTrue(OutputFormat.ARROW.is_compatible_file_extension("feather"))
+        self.assertFalse(OutputFormat.ARROW.is_compatible_file_extension("XXX"))
 
     def test_every_format_has_file_extensions(self):
         for output_format in OutputFormat:
@@ -61,8 +119,19 @@ class TestOutputFormat(unittest.TestCase):
         self.assertEqual(OutputFormat.output_format_from_extension("gdx"), OutputFormat.GDX)
         self.assertEqual(OutputFormat.output_format_from_extension("sqlite"), OutputFormat.SQL)
         self.assertEqual(OutputFormat.output_format_from_extension("xlsx"), OutputFormat.EXCEL)
+        self.assertEqual(OutputFormat.output_format_from_extension("parquet"), OutputFormat.PARQUET)
+        self.assertEqual(OutputFormat.output_format_from_extension("arrow"), OutputFormat.ARROW)
+        self.assertEqual(OutputFormat.output_format_from_extension("feather"), OutputFormat.ARROW)
         self.assertIsNone(OutputFormat.output_format_from_extension("XXX"))
 
+    def test_multi_file_capable_formats(self):
+        self.assertTrue(OutputFormat.CSV.is_multi_file_capable())
+        self.assertTrue(OutputFormat.PARQUET.is_multi_file_capable())
+        self.assertTrue(OutputFormat.ARROW.is_multi_file_capable())
+        self.assertFalse(OutputFormat.EXCEL.is_multi_file_capable())
+        self.assertFalse(OutputFormat.GDX.is_multi_file_capable())
+        self.assertFalse(OutputFormat.SQL.is_multi_file_capable())
+
     def test_default_format(self):
         self.assertEqual(OutputFormat.default(), OutputFormat.CSV)
 
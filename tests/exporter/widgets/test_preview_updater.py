@@ -14,12 +14,21 @@
 
 from multiprocessing import Process, Queue
 import pathlib
+import queue
 from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
 from PySide6.QtWidgets import QApplication, QComboBox, QWidget
 from spine_items.exporter.mvcmodels.full_url_list_model import FullUrlListModel
-from spine_items.exporter.widgets.preview_updater import PreviewUpdater, WriteTableTask, write_task_loop
+from spine_items.exporter.widgets.preview_updater import (
+    PREVIEW_WORKER_COUNT,
+    DatabaseMappingCache,
+    PreviewUpdater,
+    WriteTableTask,
+    _add_task,
+    _write_tables,
+    write_task_loop,
+)
 from spinedb_api import DatabaseMapping
 from spinedb_api.export_mapping.export_mapping import AlternativeMapping
 from spinedb_api.export_mapping.group_functions import NoGroup
@@ -64,6 +73,25 @@ class TestPreviewUpdater(unittest.TestCase):
             self.assertIsNot(preview_updater._url_model, url_model)
             preview_updater.tear_down()
 
+    def test_tasks_are_routed_to_writers_by_url(self):
+        with parent_widget() as window:
+            setattr(window, "current_mapping_about_to_change", mock.MagicMock())
+            setattr(window, "current_mapping_changed", mock.MagicMock())
+            ui = mock.MagicMock()
+            ui.database_url_combo_box = QComboBox(self._parent_widget)
+            preview_updater = PreviewUpdater(
+                window, ui, FullUrlListModel(), mock.MagicMock(), mock.MagicMock(), mock.MagicMock(), ""
+            )
+            with mock.patch("spine_items.exporter.widgets.preview_updater.Process") as process_class:
+                process_class.return_value.is_alive.return_value = False
+                urls = [f"sqlite:///db{i}.sqlite" for i in range(PREVIEW_WORKER_COUNT + 1)]
+                senders = [preview_updater._writer_sender(url) for url in urls]
+                self.assertEqual(process_class.call_count, PREVIEW_WORKER_COUNT)
+                self.assertEqual(len(set(map(id, senders))), PREVIEW_WORKER_COUNT)
+                self.assertIs(senders[-1], senders[0])
+                self.assertIs(preview_updater._writer_sender(urls[1]), senders[1])
+                preview_updater.tear_down()
+
 
 class TestWriteTaskLoop(unittest.TestCase):
     def test_quit(self):
@@ -135,6 +163,116 @@ class TestWriteTaskLoop(unittest.TestCase):
             self.assertTrue(receiver.get(), "finished")
             process.join()
 
+    def test_superseded_task_is_dropped(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(pathlib.Path(temp_dir) / "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                db_map.add_alternative_item(name="alt1")
+                db_map.commit_session("Add test data.")
+            db_map.close()
+            sender = Queue()
+            receiver = Queue()
+            sender.put(WriteTableTask(url, "my mapping", 1.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME))
+            sender.put(WriteTableTask(url, "my mapping", 2.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME))
+            process = Process(target=write_task_loop, args=(receiver, sender))
+            process.start()
+            tables = receiver.get()
+            self.assertEqual(tables, ((url, "my mapping"), "my mapping", {None: [["Base"], ["alt1"]]}, 2.0))
+            sender.put("quit")
+            self.assertEqual(receiver.get(), "finished")
+            process.join()
+            with self.assertRaises(queue.Empty):
+                receiver.get_nowait()
+
+
+class TestDatabaseMappingCache(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _make_database(self, name):
+        url = "sqlite:///" + str(pathlib.Path(self._temp_dir.name) / name)
+        with DatabaseMapping(url, create=True) as db_map:
+            db_map.add_alternative_item(name="alt1")
+            db_map.commit_session("Add test data.")
+        db_map.close()
+        return url
+
+    def test_same_url_returns_cached_mapping(self):
+        url = self._make_database("db.sqlite")
+        cache = DatabaseMappingCache(2)
+        db_map = cache.get(url)
+        self.assertIs(cache.get(url), db_map)
+        cache.close()
+
+    def test_least_recently_used_mapping_is_evicted(self):
+        url_1 = self._make_database("db1.sqlite")
+        url_2 = self._make_database("db2.sqlite")
+        url_3 = self._make_database("db3.sqlite")
+        cache = DatabaseMappingCache(2)
+        db_map_1 = cache.get(url_1)
+        db_map_2 = cache.get(url_2)
+        self.assertIs(cache.get(url_1), db_map_1)
+        cache.get(url_3)
+        self.assertIs(cache.get(url_1), db_map_1)
+        self.assertIsNot(cache.get(url_2), db_map_2)
+        cache.close()
+
+    def test_new_commit_invalidates_cached_mapping(self):
+        url = self._make_database("db.sqlite")
+        cache = DatabaseMappingCache(2)
+        db_map = cache.get(url)
+        with DatabaseMapping(url) as other_db_map:
+            other_db_map.add_alternative_item(name="alt2")
+            other_db_map.commit_session("Add more data.")
+        other_db_map.close()
+        refreshed_db_map = cache.get(url)
+        self.assertIsNot(refreshed_db_map, db_map)
+        with refreshed_db_map:
+            self.assertEqual(
+                {item["name"] for item in refreshed_db_map.get_items("alternative")}, {"Base", "alt1", "alt2"}
+            )
+        cache.close()
+
+
+class TestAddTask(unittest.TestCase):
+    def test_newer_task_replaces_older_one(self):
+        tasks = {}
+        old_task = WriteTableTask("sqlite://", "my mapping", 1.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        new_task = WriteTableTask("sqlite://", "my mapping", 2.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        _add_task(tasks, old_task)
+        _add_task(tasks, new_task)
+        self.assertEqual(tasks, {("sqlite://", "my mapping"): new_task})
+
+    def test_older_task_does_not_replace_newer_one(self):
+        tasks = {}
+        old_task = WriteTableTask("sqlite://", "my mapping", 1.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        new_task = WriteTableTask("sqlite://", "my mapping", 2.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        _add_task(tasks, new_task)
+        _add_task(tasks, old_task)
+        self.assertEqual(tasks, {("sqlite://", "my mapping"): new_task})
+
+    def test_tasks_for_different_mappings_are_kept(self):
+        tasks = {}
+        task_1 = WriteTableTask("sqlite://", "mapping 1", 2.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        task_2 = WriteTableTask("sqlite://", "mapping 2", 1.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+        _add_task(tasks, task_1)
+        _add_task(tasks, task_2)
+        self.assertEqual(list(tasks.values()), [task_1, task_2])
+
+
+class TestWriteTables(unittest.TestCase):
+    def test_aborted_write_returns_none(self):
+        with TemporaryDirectory() as temp_dir:
+            url = "sqlite:///" + str(pathlib.Path(temp_dir) / "db.sqlite")
+            with DatabaseMapping(url, create=True) as db_map:
+                task = WriteTableTask(url, "my mapping", 1.0, AlternativeMapping(0), True, 1, 3, NoGroup.NAME)
+                self.assertIsNone(_write_tables(db_map, task, lambda: False))
+                self.assertEqual(_write_tables(db_map, task, lambda: True), {None: [["Base"]]})
+            db_map.close()
+
 
 if __name__ == "__main__":
     unittest.main()
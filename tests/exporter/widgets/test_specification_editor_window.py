@@ -20,7 +20,13 @@ from unittest import mock
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication, QMessageBox
-from spine_items.exporter.specification import MappingSpecification, MappingType, OutputFormat, Specification
+from spine_items.exporter.specification import (
+    MappingSpecification,
+    MappingType,
+    OutputCompression,
+    OutputFormat,
+    Specification,
+)
 from spine_items.exporter.widgets.specification_editor_window import SpecificationEditorWindow
 from spinedb_api.export_mapping.export_mapping import EntityClassMapping, FixedValueMapping
 from spinedb_api.export_mapping.export_mapping import from_dict as mappings_from_dict
@@ -84,6 +90,21 @@ class TestSpecificationEditorWindow(unittest.TestCase):
         with mock.patch("spinetoolbox.project_item.specification_editor_window.save_ui"):
             editor.tear_down()
 
+    def test_compression_is_enabled_only_for_compressible_formats(self):
+        editor = SpecificationEditorWindow(self._toolbox)
+        self.assertTrue(editor._ui.compression_combo_box.isEnabled())
+        editor._ui.compression_combo_box.setCurrentText(OutputCompression.GZIP.value)
+        self.assertEqual(editor._new_spec.compression, OutputCompression.GZIP)
+        editor._ui.export_format_combo_box.setCurrentText(OutputFormat.SQL.value)
+        self.assertFalse(editor._ui.compression_combo_box.isEnabled())
+        editor._undo_stack.undo()
+        editor._undo_stack.undo()
+        self.assertTrue(editor._ui.compression_combo_box.isEnabled())
+        self.assertEqual(editor._ui.compression_combo_box.currentText(), OutputCompression.NONE.value)
+        self.assertEqual(editor._new_spec.compression, OutputCompression.NONE)
+        with mock.patch("spinetoolbox.project_item.specification_editor_window.save_ui"):
+            editor.tear_down()
+
     def test_duplicate_specification(self):
         flattened_mappings = [FixedValueMapping(Position.table_name, "nice table name"), EntityClassMapping(0)]
         mapping_specification = MappingSpecification(